@@ -1,53 +1,115 @@
 from fastmcp import FastMCP, Context
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass, asdict, is_dataclass 
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
 import os
-import json
-import sys # For printing to stderr
+import orjson
+import re
+import sys
+import logging
 import asyncio
-from datetime import date, datetime, timezone # Already here
-from typing import Any, Callable, Iterator, List, Optional, Union, Literal # For type hints
-
-from todoist_api_python.api import TodoistAPI
-from todoist_api_python.models import Task, Project, Section, Label, Comment, Collaborator, Attachment # Import models
-
-from utils import get_todoist_client
-
-load_dotenv() 
-
-@dataclass
+import contextvars
+import functools
+import inspect
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, List, Optional, Literal # For type hints
+
+from cachetools import TTLCache
+if TYPE_CHECKING: # The SDK is imported when the client is first created (utils.get_todoist_client)
+    from todoist_api_python.api import TodoistAPI
+
+# Launchers such as Claude Desktop inject the token directly; skip importing dotenv and reading .env then.
+# Runs before importing utils, which reads its settings from the environment at import.
+if not os.getenv("TODOIST_API_TOKEN"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+from utils import POOL_MAXSIZE, TodoistConnection, get_todoist_client
+
+# stdout carries the MCP protocol on the stdio transport, so all logging goes to stderr.
+# Messages use lazy %-formatting, so disabled levels (DEBUG by default) cost almost nothing.
+logger = logging.getLogger("todoist_mcp")
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_log_handler)
+logger.propagate = False
+_log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+try:
+    logger.setLevel(_log_level)
+except ValueError: # Unknown level name: keep the server starting
+    logger.setLevel(logging.INFO)
+    logger.warning("Warning: Invalid LOG_LEVEL value '%s'. Defaulting to INFO.", _log_level)
+
+# get_tasks responses are served from cache for this long; task mutations invalidate them early.
+TASKS_CACHE_TTL_SECONDS = 45
+# Section, label and comment reads are served from cache for this long; their mutations invalidate them early.
+READ_CACHE_TTL_SECONDS = float(os.getenv("TODOIST_READ_CACHE_TTL", "30"))
+# Threads dedicated to blocking SDK calls; defaults to the HTTP connection pool size.
+SDK_WORKERS = int(os.getenv("TODOIST_WORKERS", str(POOL_MAXSIZE)))
+
+# slots: the context is read on every tool call, so skip the per-instance __dict__.
+# Not frozen, because _get_or_init_client stores a lazily created client on it.
+@dataclass(slots=True)
 class ToDoistContext:
-    todoist_client: Optional[TodoistAPI] = None # Allow client to be None initially
+    todoist_client: Optional["TodoistAPI"] = None # Allow client to be None initially
+    # Session and token the client was built with; set together with todoist_client, used for Sync API batching
+    connection: Optional[TodoistConnection] = None
+    # Serialized get_tasks responses keyed by (project_id, other filters)
+    tasks_cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=128, ttl=TASKS_CACHE_TTL_SECONDS))
+    # Bumped by every task invalidation; get_tasks only caches a response if it is unchanged across the fetch
+    tasks_generation: int = 0
+    # SDK results of section/label/comment reads keyed by (kind, *args), e.g. ("section", section_id)
+    read_cache: TTLCache = field(default_factory=lambda: TTLCache(maxsize=4096, ttl=READ_CACHE_TTL_SECONDS))
+    # Reads currently in flight, so concurrent callers of the same key share one request
+    pending_reads: dict[tuple, asyncio.Future] = field(default_factory=dict)
+    # Pool that runs the blocking SDK calls, kept apart from asyncio's shared default executor
+    executor: Optional[ThreadPoolExecutor] = None
+
+# The running session's context. Set when the lifespan starts, before FastMCP spawns the request
+# handlers, so every tool call inherits it and resolves it with one ContextVar read.
+_lifespan_ctx_var: contextvars.ContextVar[ToDoistContext] = contextvars.ContextVar("todoist_lifespan_ctx")
+
+def _lifespan(ctx: Context) -> ToDoistContext:
+    """Returns the session's ToDoistContext, falling back to the request context if the var is unset."""
+    lifespan_ctx = _lifespan_ctx_var.get(None)
+    if lifespan_ctx is None:
+        lifespan_ctx = ctx.request_context.lifespan_context # type: ignore
+    return lifespan_ctx
 
 @asynccontextmanager
 async def todoist_lifespan(server: FastMCP) -> AsyncIterator[ToDoistContext]:
-    print("Lifespan: Initializing Todoist client (lazy loading enabled)...", file=sys.stderr)
-    client_instance: Optional[TodoistAPI] = None
+    logger.info("Lifespan: Initializing Todoist client (lazy loading enabled)...")
+    connection: Optional[TodoistConnection] = None
     # Attempt to initialize the client if the token is available in the environment
     # This allows pre-initialization if the token is already set.
     # If not, tools will initialize it on demand.
     if os.getenv("TODOIST_API_TOKEN"):
         try:
-            client_instance = get_todoist_client()
-            print("Lifespan: Todoist client pre-initialized successfully from environment variable.", file=sys.stderr)
+            connection = get_todoist_client()
+            logger.info("Lifespan: Todoist client pre-initialized successfully from environment variable.")
         except ValueError as ve:
             # This case should ideally not be hit if os.getenv("TODOIST_API_TOKEN") was true,
             # but kept for robustness.
-            print(f"Lifespan warning during pre-initialization: {ve}. Client will be initialized by the first tool call if token is provided then.", file=sys.stderr)
+            logger.warning("Lifespan warning during pre-initialization: %s. Client will be initialized by the first tool call if token is provided then.", ve)
         except Exception as e:
-            print(f"Lifespan ERROR: Unexpected exception during Todoist client pre-initialization: {e}. Client will remain uninitialized.", file=sys.stderr)
+            logger.error("Lifespan ERROR: Unexpected exception during Todoist client pre-initialization: %s. Client will remain uninitialized.", e)
     else:
-        print("Lifespan: TODOIST_API_TOKEN not found in environment at startup. Client will be initialized by the first tool call if token is available then.", file=sys.stderr)
+        logger.info("Lifespan: TODOIST_API_TOKEN not found in environment at startup. Client will be initialized by the first tool call if token is available then.")
 
-    context = ToDoistContext(todoist_client=client_instance)
+    executor = ThreadPoolExecutor(max_workers=SDK_WORKERS, thread_name_prefix="todoist")
+    executor.submit(lambda: None) # Start one worker now so the first tool call doesn't pay thread start-up
+    context = ToDoistContext(todoist_client=connection.client if connection else None, connection=connection, executor=executor)
+    _lifespan_ctx_var.set(context)
     try:
         yield context
     finally:
-        print("Lifespan: Exiting lifespan.", file=sys.stderr)
-        # No specific cleanup needed for the client here as it's managed by the TodoistAPI instance
-        pass
+        logger.info("Lifespan: Exiting lifespan.")
+        executor.shutdown(wait=False)
+        # The client may have been created lazily by a tool; close its pooled HTTP session either way.
+        if context.todoist_client is not None:
+            context.todoist_client.__exit__(None, None, None)
 # Initialize FastMCP
 mcp = FastMCP(
     "todoist",
@@ -55,131 +117,409 @@ mcp = FastMCP(
     lifespan=todoist_lifespan
 )
 
-# Helper for paginated results (no changes needed here)
+async def _run_sdk(ctx: Context, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Runs a blocking SDK call on the lifespan's dedicated executor."""
+    executor = _lifespan(ctx).executor
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+# Largest page the Todoist API accepts (its default is 50). Pages are cursor-chained, so they
+# can't be fetched in parallel; asking for bigger ones cuts the number of round trips instead.
+MAX_PAGE_SIZE = 200
+
+# Helper for paginated results
 async def _fetch_all_from_paginator(
+    ctx: Context,
     paginator_func: Callable[..., Iterator[List[Any]]],
+    max_items: Optional[int] = None,
     **kwargs: Any
 ) -> List[Any]:
+    # max_items stops paging once that many items are in hand instead of draining every page.
+    if max_items is not None:
+        if max_items <= 0:
+            return []
+        kwargs.setdefault("limit", min(max_items, MAX_PAGE_SIZE))
+    else:
+        kwargs.setdefault("limit", MAX_PAGE_SIZE)
     def sync_fetch():
         paginator = paginator_func(**kwargs)
         all_items = []
         for page in paginator:
             all_items.extend(page)
+            if max_items is not None and len(all_items) >= max_items:
+                return all_items[:max_items]
         return all_items
-    return await asyncio.to_thread(sync_fetch)
+    return await _run_sdk(ctx, sync_fetch)
 
-# NEW: Custom JSON serializer for datetime objects
-def json_datetime_serializer(obj: Any) -> str:
-    """JSON serializer for objects not serializable by default json code,
-    especially datetime objects."""
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()  # Convert datetime/date to ISO 8601 string
-    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+# Encoder for tool responses, resolved once at import rather than per call
+_dumps = orjson.dumps
 
-# MODIFIED: _serialize_response to use the custom serializer
 def _serialize_response(data: Any) -> str:
     """
     Serializes SDK model objects (which are dataclasses), lists of them,
     or other data (like booleans or simple strings) to a JSON string.
-    Handles datetime objects by converting them to ISO 8601 format.
+    orjson encodes dataclasses, datetimes and dates natively (ISO 8601), so no asdict() copy
+    or default= hook is needed.
     """
-    prepared_data: Any
-
-    if isinstance(data, list):
-        prepared_data = [
-            asdict(item) if is_dataclass(item) and not isinstance(item, type) else item
-            for item in data
-        ]
-    elif is_dataclass(data) and not isinstance(data, type): 
-        prepared_data = asdict(data)
-    else:
-        prepared_data = data
-    
     try:
-        return json.dumps(prepared_data, default=json_datetime_serializer, indent=2)
-    except TypeError as e:
-        error_message = (f"Serialization Error in _serialize_response: {e}. "
-                         f"Problematic data type: {type(prepared_data)}. "
-                         f"Snippet (first 500 chars): {str(prepared_data)[:500]}")
-        print(error_message, file=sys.stderr)
-        return json.dumps({"error": "Failed to serialize response", "details": str(e)})
+        # Compact output: responses are parsed by the MCP client, and indentation only costs tokens.
+        return _dumps(data).decode()
+    except TypeError as e: # orjson.JSONEncodeError is a TypeError
+        logger.error("Serialization Error in _serialize_response: %s. Problematic data type: %s. Snippet (first 500 chars): %.500s",
+                     e, type(data), data)
+        return _dumps({"error": "Failed to serialize response", "details": str(e)}).decode()
     except Exception as e_gen: 
-        error_message = (f"Generic JSON Dumping Error in _serialize_response: {e_gen}. "
-                         f"Data snippet (first 500 chars): {str(prepared_data)[:500]}")
-        print(error_message, file=sys.stderr)
-        return json.dumps({"error": "A general error occurred during JSON serialization", "details": str(e_gen)})
-
-# Helper for preparing API arguments (no changes needed here, already handles date parsing)
-def _prepare_api_kwargs(**kwargs: Any) -> dict[str, Any]:
-    """Filters out None values and prepares kwargs for API calls."""
-    parsed_kwargs = {}
-    for k, v in kwargs.items():
-        if v is None:
-            continue
-        
-        new_v = v
-        if k in ('due_date', 'deadline_date') and isinstance(v, str):
-            try:
-                new_v = date.fromisoformat(v)
-            except ValueError:
-                pass 
-        elif k in ('due_datetime', 'since', 'until') and isinstance(v, str):
-            try:
-                new_v = datetime.fromisoformat(v)
-            except ValueError:
-                pass 
-        parsed_kwargs[k] = new_v
-    return parsed_kwargs
+        logger.error("Generic JSON Dumping Error in _serialize_response: %s. Data snippet (first 500 chars): %.500s",
+                     e_gen, data)
+        return _dumps({"error": "A general error occurred during JSON serialization", "details": str(e_gen)}).decode()
+
+
+# ISO string parsers for the SDK arguments typed as date/datetime, keyed by argument name
+# date/datetime are immutable, so repeated strings (agents resend the same dates) are parsed once.
+_parse_date = functools.lru_cache(maxsize=4096)(date.fromisoformat)
+_parse_datetime = functools.lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+_DATE_ARG_PARSERS: dict[str, Callable[[str], Any]] = {
+    'due_date': _parse_date,
+    'deadline_date': _parse_date,
+    'due_datetime': _parse_datetime,
+    'since': _parse_datetime,
+    'until': _parse_datetime,
+}
+
+def _parse_api_value(k: str, v: Any) -> Any:
+    """Parses ISO date/datetime strings for the date-typed SDK arguments; other values pass through."""
+    parser = _DATE_ARG_PARSERS.get(k)
+    if parser is not None and type(v) is str:
+        try:
+            return parser(v)
+        except ValueError:
+            pass 
+    return v
+
+# Helpers for preparing API arguments
+def _drop_none(**kwargs: Any) -> dict[str, Any]:
+    """Drops None-valued arguments. Values pass through as-is; date strings are parsed by _parse_api_value."""
+    return {k: v for k, v in kwargs.items() if v is not None}
 
 # --- Generic Client Getter for Tools ---
-async def _get_or_init_client(ctx: Context, tool_name_for_log: str) -> TodoistAPI:
-    lifespan_ctx: ToDoistContext = ctx.request_context.lifespan_context # type: ignore
-    
-    if lifespan_ctx.todoist_client is None:
-        print(f"Tool '{tool_name_for_log}': Client not pre-initialized. Attempting to initialize now...", file=sys.stderr)
-        try:
-            # This will fetch the token from the environment
-            client = get_todoist_client() 
-            lifespan_ctx.todoist_client = client # Store for subsequent calls
-            print(f"Tool '{tool_name_for_log}': Client initialized successfully on demand.", file=sys.stderr)
-        except ValueError as ve: # Token not set or other issues from get_todoist_client
-            print(f"Tool '{tool_name_for_log}' ERROR: {ve}", file=sys.stderr)
-            # Re-raise to be caught by the tool's error handler, which will serialize it.
-            raise 
-        except Exception as e: # Other unexpected init errors
-            print(f"Tool '{tool_name_for_log}' ERROR: Failed to initialize Todoist client on demand: {e}", file=sys.stderr)
-            raise # Re-raise
-    
-    # At this point, lifespan_ctx.todoist_client should be non-None if initialization succeeded.
-    # If initialization failed, an exception would have been raised.
-    if lifespan_ctx.todoist_client is None:
-        # This should ideally not be reached if exceptions are handled correctly above.
-        # However, as a safeguard:
+async def _get_or_init_client(ctx: Context, tool_name_for_log: str) -> "TodoistAPI":
+    """Returns the shared client, creating it on first use. Raises instead of returning None, so callers need no check."""
+    # Fast path: once initialized, the client is one context lookup and one attribute load away.
+    lifespan_ctx = _lifespan(ctx)
+    client = lifespan_ctx.todoist_client
+    if client is not None:
+        return client
+
+    logger.info("Tool '%s': Client not pre-initialized. Attempting to initialize now...", tool_name_for_log)
+    try:
+        # This will fetch the token from the environment
+        connection = get_todoist_client() 
+        client = connection.client
+        lifespan_ctx.connection = connection
+        lifespan_ctx.todoist_client = client # Store for subsequent calls
+        logger.info("Tool '%s': Client initialized successfully on demand.", tool_name_for_log)
+    except ValueError as ve: # Token not set or other issues from get_todoist_client
+        logger.error("Tool '%s' ERROR: %s", tool_name_for_log, ve)
+        # Re-raise to be caught by the tool's error handler, which will serialize it.
+        raise 
+    except Exception as e: # Other unexpected init errors
+        logger.error("Tool '%s' ERROR: Failed to initialize Todoist client on demand: %s", tool_name_for_log, e)
+        raise # Re-raise
+
+    if client is None:
+        # get_todoist_client raises on failure, so this is only a safeguard.
         err_msg = "Todoist client could not be initialized due to a persistent issue. Please check logs."
-        print(f"Tool '{tool_name_for_log}' FATAL ERROR: {err_msg}", file=sys.stderr)
+        logger.error("Tool '%s' FATAL ERROR: %s", tool_name_for_log, err_msg)
         raise RuntimeError(err_msg) # Raise a runtime error as this is an unexpected state
 
-    return lifespan_ctx.todoist_client
+    return client
+
+# --- get_tasks cache helpers ---
+def _tasks_cache_key(api_kwargs: dict[str, Any]) -> tuple:
+    filters = tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v)
+        for k, v in api_kwargs.items() if k != "project_id"
+    ))
+    return (api_kwargs.get("project_id"), filters)
+
+def _invalidate_tasks_cache(ctx: Context, project_id: Optional[str] = None) -> None:
+    """Drops cached get_tasks responses that a mutation may have changed.
+    Without a project_id (e.g. complete_task only knows the task) every entry is dropped."""
+    _invalidate_read_cache(ctx, "task", "tasks")
+    lifespan_ctx = _lifespan(ctx)
+    lifespan_ctx.tasks_generation += 1
+    tasks_cache: TTLCache = lifespan_ctx.tasks_cache
+    if project_id is None:
+        tasks_cache.clear()
+        return
+    for key in [k for k in tasks_cache if k[0] in (project_id, None)]:
+        tasks_cache.pop(key, None)
+
+# --- Read cache for sections, labels and comments ---
+# Everything runs on the event loop thread, so the cache and pending map need no lock.
+class _ReadAbandoned(Exception):
+    """Set on a shared read whose owner was cancelled mid-fetch; waiters then start their own fetch."""
+
+async def _cached_read(ctx: Context, key: tuple, fetch: Callable[[], Awaitable[Any]], store: bool = True) -> Any:
+    """Returns fetch()'s result through the read cache; concurrent misses on the same key share one fetch.
+    With store=False only the sharing applies (single-flight), for reads that must not be served stale."""
+    lifespan_ctx = _lifespan(ctx)
+    if store:
+        cached = lifespan_ctx.read_cache.get(key)
+        if cached is not None:
+            return cached
+    pending = lifespan_ctx.pending_reads.get(key)
+    if pending is not None:
+        try:
+            return await asyncio.shield(pending)
+        except _ReadAbandoned: # The caller that owned the fetch was cancelled; fetch again
+            return await _cached_read(ctx, key, fetch, store)
+
+    future = asyncio.get_running_loop().create_future()
+    lifespan_ctx.pending_reads[key] = future
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        # Only this caller was cancelled: hand the read back to the waiters instead of cancelling them too.
+        if lifespan_ctx.pending_reads.get(key) is future:
+            del lifespan_ctx.pending_reads[key]
+        future.set_exception(_ReadAbandoned())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception() # Mark retrieved: there may be no other waiter
+        raise
+    finally:
+        # An invalidation during the fetch removes our entry; then the result may be stale and isn't stored.
+        still_current = lifespan_ctx.pending_reads.get(key) is future
+        if still_current:
+            del lifespan_ctx.pending_reads[key]
+    if still_current and store:
+        lifespan_ctx.read_cache[key] = result
+    future.set_result(result)
+    return result
+
+def _store_read(ctx: Context, key: tuple, value: Any) -> None:
+    """Seeds the read cache with an object a mutation just returned, so the next get_* is a hit."""
+    _lifespan(ctx).read_cache[key] = value
+
+def _invalidate_read_cache(ctx: Context, *kinds: str) -> None:
+    """Drops cached and in-flight reads whose key starts with one of kinds (e.g. "section", "sections")."""
+    lifespan_ctx = _lifespan(ctx)
+    for store in (lifespan_ctx.read_cache, lifespan_ctx.pending_reads):
+        for key in [k for k in store if k[0] in kinds]:
+            store.pop(key, None)
+
+# Fixed detail returned for every authentication failure, built once at import.
+_AUTH_ERROR_DETAIL = "Authentication failed. Please ensure your TODOIST_API_TOKEN is set correctly and has the necessary permissions."
+
 def _handle_tool_error(e: Exception, tool_name: str, item_id: Optional[str] = None) -> str:
-    item_info = f" for item {item_id}" if item_id else ""
-    error_message_prefix = f"Error in {tool_name}{item_info}"
-    print(f"{error_message_prefix}: {e}", file=sys.stderr)
-    
-    error_detail = str(e)
     error_summary = f"Error in {tool_name}"
+    error_message_prefix = f"{error_summary} for item {item_id}" if item_id else error_summary
+    error_detail = str(e) # Converted once; reused for logging and every check below
+    logger.error("%s: %s", error_message_prefix, error_detail)
 
-    if "401" in str(e) or "Forbidden" in str(e) or "authentication" in str(e).lower() or isinstance(e, ValueError) and "TODOIST_API_TOKEN" in str(e):
+    lowered = error_detail.lower()
+    missing_token = isinstance(e, ValueError) and "TODOIST_API_TOKEN" in error_detail
+    if missing_token or "401" in error_detail or "forbidden" in lowered or "authentication" in lowered:
         error_summary = f"{error_message_prefix}: Authentication failed or missing token."
-        error_detail = "Authentication failed. Please ensure your TODOIST_API_TOKEN is set correctly and has the necessary permissions."
-        if isinstance(e, ValueError) and "TODOIST_API_TOKEN" in str(e): # Specifically for missing token from get_todoist_client
-             error_detail = str(e)
-
+        if not missing_token: # Keep get_todoist_client's own message for a missing token
+            error_detail = _AUTH_ERROR_DETAIL
 
     return _serialize_response({"error": error_summary, "details": error_detail})
 
+def _tool_errors(item_arg: Optional[str] = None) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """Turns anything a tool raises into its _handle_tool_error reply; item_arg names the argument reported as the item ID.
+    Applied below @mcp.tool(), so FastMCP still sees the tool's own signature through __wrapped__."""
+    def decorate(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        tool_name = fn.__name__
+        signature = inspect.signature(fn)
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                item_id = None
+                if item_arg:
+                    try: # Binding also finds the ID when it was passed positionally
+                        item_id = signature.bind_partial(*args, **kwargs).arguments.get(item_arg)
+                    except TypeError:
+                        pass
+                return _handle_tool_error(e, tool_name, item_id)
+        return wrapper
+    return decorate
+
+# --- Shared tool bodies ---
+# Tools that only make one SDK call differ just in the method and cache keys,
+# so they delegate here instead of each repeating the client/serialize skeleton.
+# Each tool is named after the SDK method it calls, so tool_name doubles as the method name.
+# Task tools and the project archive/delete actions stay explicit because they also scope the get_tasks cache;
+# paginated list reads and the shared-label actions stay explicit because their replies are built differently.
+async def _dispatch_read(ctx: Context, tool_name: str, key: tuple, /, *, store: bool = True, **kwargs: Any) -> str:
+    """Runs a single-object get_* through the read cache (with store=False, only through its single-flight)."""
+    client = await _get_or_init_client(ctx, tool_name)
+    logger.debug("Tool '%s' called with %s", tool_name, kwargs)
+    method = getattr(client, tool_name)
+    result = await _cached_read(ctx, key, lambda: _run_sdk(ctx, method, **kwargs), store=store)
+    return _serialize_response(result)
+
+async def _dispatch_write(
+    ctx: Context,
+    tool_name: str,
+    invalidates: tuple[str, ...],
+    /,
+    *,
+    store_key: Optional[tuple] = None,
+    **kwargs: Any
+) -> str:
+    """Runs an add_*/update_* call, invalidates the given read-cache kinds and returns the resulting object.
+    store_key seeds the read cache with that object, so a following get_* is a hit."""
+    client = await _get_or_init_client(ctx, tool_name)
+    logger.debug("Tool '%s' called with %s", tool_name, kwargs)
+    result = await _run_sdk(ctx, getattr(client, tool_name), **kwargs)
+    _invalidate_read_cache(ctx, *invalidates)
+    if store_key is not None:
+        _store_read(ctx, store_key, result)
+    return _serialize_response(result)
+
+async def _dispatch_delete(ctx: Context, tool_name: str, id_arg: str, item_id: str, invalidates: tuple[str, ...], /) -> str:
+    """Runs a delete_* call, invalidates the given read-cache kinds and returns the {"success", <id_arg>, "action"} reply."""
+    client = await _get_or_init_client(ctx, tool_name)
+    logger.debug("Tool '%s' called for %s='%s'", tool_name, id_arg, item_id)
+    success = await _run_sdk(ctx, getattr(client, tool_name), **{id_arg: item_id})
+    _invalidate_read_cache(ctx, *invalidates)
+    return _serialize_response({"success": success, id_arg: item_id, "action": "deleted"})
+
+# --- Sync API batching ---
+# The REST SDK has no bulk endpoint, but the Sync API accepts many commands in one request.
+SYNC_API_URL = "https://api.todoist.com/api/v1/sync"
+
+# add_task field -> Sync API item_add arg, for the fields passed through unchanged
+_SYNC_ITEM_FIELDS = {
+    "content": "content", "description": "description", "project_id": "project_id",
+    "section_id": "section_id", "parent_id": "parent_id", "labels": "labels", "priority": "priority",
+    "assignee_id": "responsible_uid", "order": "child_order",
+    "auto_reminder": "auto_reminder", "auto_parse_labels": "auto_parse_labels",
+}
+# Fields that are nested into due/deadline/duration objects, plus the batch-only temp_id
+_SYNC_NESTED_FIELDS = frozenset({
+    "due_string", "due_date", "due_datetime", "due_lang", "deadline_date", "deadline_lang",
+    "duration", "duration_unit", "temp_id",
+})
+
+def _to_sync_item_args(task_args: dict[str, Any]) -> dict[str, Any]:
+    """Maps add_task-style fields onto Sync API item_add args, where due/deadline/duration are nested objects.
+    Raises ValueError for unknown fields or malformed dates, before anything is sent."""
+    unknown = task_args.keys() - _SYNC_ITEM_FIELDS.keys() - _SYNC_NESTED_FIELDS
+    if unknown:
+        raise ValueError(f"Unsupported task fields: {', '.join(sorted(unknown))}")
+    args = {_SYNC_ITEM_FIELDS[k]: v for k, v in task_args.items() if v is not None and k in _SYNC_ITEM_FIELDS}
+    # Dates are validated like add_task's, but sent as given: the Sync API takes the ISO strings.
+    for k in ("due_date", "due_datetime", "deadline_date"):
+        v = task_args.get(k)
+        if v is not None:
+            try:
+                _DATE_ARG_PARSERS[k](v)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid {k} {v!r}: {e}") from None
+    due = {}
+    if task_args.get("due_string") is not None: due["string"] = task_args["due_string"]
+    if task_args.get("due_date") is not None: due["date"] = task_args["due_date"]
+    if task_args.get("due_datetime") is not None: due["date"] = task_args["due_datetime"]
+    if task_args.get("due_lang") is not None: due["lang"] = task_args["due_lang"]
+    if due: args["due"] = due
+    if task_args.get("deadline_date") is not None:
+        args["deadline"] = {"date": task_args["deadline_date"]}
+        if task_args.get("deadline_lang") is not None: args["deadline"]["lang"] = task_args["deadline_lang"]
+    if task_args.get("duration") is not None:
+        args["duration"] = {"amount": task_args["duration"], "unit": task_args.get("duration_unit") or "minute"}
+    return args
+
+def _post_sync_commands(connection: TodoistConnection, commands: List[dict[str, Any]]) -> dict[str, Any]:
+    """Sends all commands in a single Sync API request, reusing the SDK client's pooled session."""
+    response = connection.session.post(
+        SYNC_API_URL,
+        headers={"Authorization": f"Bearer {connection.token}"},
+        data={"commands": _dumps(commands)}, # Compact UTF-8, like tool responses
+        timeout=(10, 60),
+    )
+    response.raise_for_status()
+    return response.json()
+
 
 # --- Task Functions ---
+# Upper bound on concurrent Todoist requests issued by a single batch tool call.
+BATCH_CONCURRENCY = 10
+
+def _success_response(id_key: str, action: str) -> Callable[[str], str]:
+    """Returns a formatter for the fixed {"success": true, <id_key>: ..., "action": ...} reply of a successful action."""
+    template = '{"success":true,"%s":%%s,"action":"%s"}' % (id_key, action)
+    return lambda item_id: template % _dumps(item_id).decode()
+
+# Successful replies of the simple task/project actions, formatted without going through _serialize_response
+_TASK_COMPLETED = _success_response("task_id", "completed")
+_TASK_REOPENED = _success_response("task_id", "reopened")
+_TASK_DELETED = _success_response("task_id", "deleted")
+_PROJECT_ARCHIVED = _success_response("project_id", "archived")
+_PROJECT_UNARCHIVED = _success_response("project_id", "unarchived")
+
+# Todoist IDs are short alphanumeric strings. Anything else (empty, whitespace, slashes) can't name a
+# resource, so it is rejected before spending a round trip on a guaranteed 4xx.
+_ID_MATCH = re.compile(r"\A[0-9A-Za-z]{1,64}\Z").match
+
+def _invalid_id_reply(arg_name: str) -> str:
+    """Serializes the error reply for a malformed ID argument; called once per argument name at import."""
+    return _serialize_response({"error": f"Invalid {arg_name}", "details": "Expected a Todoist ID (letters and digits only)."})
+
+_INVALID_TASK_ID = _invalid_id_reply("task_id")
+_INVALID_PROJECT_ID = _invalid_id_reply("project_id")
+_INVALID_SECTION_ID = _invalid_id_reply("section_id")
+_INVALID_LABEL_ID = _invalid_id_reply("label_id")
+_INVALID_COMMENT_ID = _invalid_id_reply("comment_id")
+# Replies for the optional ID arguments checked by _check_ids, keyed by argument name
+_INVALID_ID_REPLIES = {
+    "task_id": _INVALID_TASK_ID,
+    "project_id": _INVALID_PROJECT_ID,
+    "section_id": _INVALID_SECTION_ID,
+    "parent_id": _invalid_id_reply("parent_id"),
+    "ids": _invalid_id_reply("ids"),
+}
+
+def _check_ids(**ids: Optional[str]) -> Optional[str]:
+    """Returns the error reply for the first ID argument that is set but malformed, or None if all are fine."""
+    for arg_name, value in ids.items():
+        if value is not None and not _ID_MATCH(value):
+            return _INVALID_ID_REPLIES[arg_name]
+    return None
+
+# Fixed argument-validation errors, serialized once at import
+_ERR_BATCH_NEEDS_TASKS = _serialize_response({"error": "add_tasks_batch requires a non-empty list of tasks, each with 'content'."})
+_ERR_MOVE_NEEDS_TARGET = _serialize_response({"error": "Either project_id, section_id or parent_id must be provided for move_task." })
+_ERR_MOVE_NO_PARAMS = _serialize_response({"error": "No move parameters provided."})
+_ERR_MOVE_FAILED = _serialize_response({"status": "failed", "message": "Move operation did not report success."})
+_ERR_ADD_COMMENT_NEEDS_PARENT = _serialize_response({"error": "Either project_id or task_id must be provided for add_comment."})
+_ERR_GET_COMMENTS_NEEDS_PARENT = _serialize_response({"error": "Either project_id or task_id must be provided for get_comments."})
+
+def _parse_date_range(since: str, until: str) -> tuple[datetime, datetime]:
+    """Parses the completed-task tools' ISO since/until bounds; a date-only until covers that whole day.
+    Raises ValueError for malformed values."""
+    since_dt = _parse_datetime(since)
+    until_dt = _parse_datetime(until)
+    if len(until) == 10: # YYYY-MM-DD: fromisoformat gave midnight, but the range is inclusive
+        until_dt = until_dt.replace(hour=23, minute=59, second=59)
+    return since_dt, until_dt
+
+# Optional add_task parameters forwarded to the SDK when provided.
+_ADD_TASK_FIELDS = (
+    "description", "project_id", "section_id", "parent_id", "labels", "priority",
+    "due_string", "due_lang", "due_date", "due_datetime", "assignee_id", "order",
+    "auto_reminder", "auto_parse_labels", "duration", "duration_unit",
+    "deadline_date", "deadline_lang",
+)
+
 @mcp.tool()
+@_tool_errors()
 async def add_task(
     ctx: Context,
     content: str,
@@ -203,40 +543,73 @@ async def add_task(
     deadline_lang: Optional[str] = None
 ) -> str:
     """Create a new task."""
-    tool_name = "add_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: # Should not happen if _get_or_init_client raises properly
-            return _serialize_response({"error": "Client could not be initialized.", "details": "Unknown error during client initialization."})
-
-        api_kwargs = _prepare_api_kwargs(
-            description=description, project_id=project_id, section_id=section_id,
-            parent_id=parent_id, labels=labels, priority=priority, due_string=due_string,
-            due_lang=due_lang, due_date=due_date, due_datetime=due_datetime,
-            assignee_id=assignee_id, order=order, auto_reminder=auto_reminder,
-            auto_parse_labels=auto_parse_labels, duration=duration, duration_unit=duration_unit,
-            deadline_date=deadline_date, deadline_lang=deadline_lang
-        )
-        print(f"Tool '{tool_name}' called with content='{content}', kwargs={api_kwargs}", file=sys.stderr)
-        task = await asyncio.to_thread(client.add_task, content=content, **api_kwargs)
-        return _serialize_response(task)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    params = locals()
+    if invalid := _check_ids(project_id=project_id, section_id=section_id, parent_id=parent_id): return invalid
+    client = await _get_or_init_client(ctx, "add_task")
+
+    # Single pass over the parameters: drop unset ones and parse dates as we go.
+    api_kwargs = {k: _parse_api_value(k, v) for k in _ADD_TASK_FIELDS if (v := params[k]) is not None}
+    logger.debug("Tool 'add_task' called with content='%s', kwargs=%s", content, api_kwargs)
+    task = await _run_sdk(ctx, client.add_task, content=content, **api_kwargs)
+    _invalidate_tasks_cache(ctx, project_id)
+    if labels:
+        _invalidate_read_cache(ctx, "shared_labels") # Unknown label names become shared labels
+    return _serialize_response(task)
 
 @mcp.tool()
+@_tool_errors()
+async def add_tasks_batch(ctx: Context, tasks: List[dict[str, Any]]) -> str:
+    """Create several tasks in a single request.
+
+    Each item accepts the add_task fields ('content' is required). An item may set
+    'temp_id', which later items can use as their 'parent_id' to create subtasks.
+    """
+    if not tasks or any(not t.get("content") for t in tasks):
+        return _ERR_BATCH_NEEDS_TASKS
+    # parent_id may also name an earlier item's temp_id, which isn't a Todoist ID yet.
+    temp_ids = {t["temp_id"] for t in tasks if t.get("temp_id")}
+    for t in tasks:
+        parent_id = t.get("parent_id")
+        invalid = _check_ids(project_id=t.get("project_id"), section_id=t.get("section_id"),
+                             parent_id=None if parent_id in temp_ids else parent_id)
+        if invalid: return invalid
+
+    commands = [
+        {"type": "item_add", "uuid": str(uuid.uuid4()), "temp_id": t.get("temp_id") or str(uuid.uuid4()), "args": _to_sync_item_args(t)}
+        for t in tasks
+    ]
+    await _get_or_init_client(ctx, "add_tasks_batch")
+    connection: TodoistConnection = _lifespan(ctx).connection # type: ignore # set along with the client
+    logger.debug("Tool 'add_tasks_batch' called with %s tasks", len(commands))
+    result = await _run_sdk(ctx, _post_sync_commands, connection, commands)
+    _invalidate_tasks_cache(ctx)
+    if any(t.get("labels") for t in tasks):
+        _invalidate_read_cache(ctx, "shared_labels")
+
+    sync_status = result.get("sync_status", {})
+    temp_id_mapping = result.get("temp_id_mapping", {})
+    return _serialize_response([
+        {
+            "content": cmd["args"]["content"],
+            "id": temp_id_mapping.get(cmd["temp_id"]),
+            "status": sync_status.get(cmd["uuid"]),
+        }
+        for cmd in commands
+    ])
+
+@mcp.tool()
+@_tool_errors("task_id")
 async def get_task(ctx: Context, task_id: str) -> str:
     """Get a specific task by its ID."""
-    tool_name = "get_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called with task_id='{task_id}'", file=sys.stderr)
-        task = await asyncio.to_thread(client.get_task, task_id=task_id)
-        return _serialize_response(task)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, task_id)
+    if not _ID_MATCH(task_id): return _INVALID_TASK_ID
+    client = await _get_or_init_client(ctx, "get_task")
+    logger.debug("Tool 'get_task' called with task_id='%s'", task_id)
+    task = await _cached_read(ctx, ("task", task_id),
+                              lambda: _run_sdk(ctx, client.get_task, task_id=task_id), store=False)
+    return _serialize_response(task)
 
 @mcp.tool()
+@_tool_errors()
 async def get_tasks(
     ctx: Context,
     project_id: Optional[str] = None,
@@ -247,26 +620,39 @@ async def get_tasks(
     limit: Optional[int] = None
 ) -> str:
     """Get active tasks, optionally filtered."""
-    tool_name = "get_tasks"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        api_kwargs = _prepare_api_kwargs(
-            project_id=project_id, section_id=section_id, parent_id=parent_id,
-            label=label, ids=ids, limit=limit # SDK might handle limit differently or not at all for get_tasks
-        )
-        print(f"Tool '{tool_name}' called with kwargs={api_kwargs}", file=sys.stderr)
-        # The `limit` in `get_tasks` of the SDK might be for pagination, not total items.
-        # _fetch_all_from_paginator already handles pagination.
-        # If a true server-side limit is desired and SDK `get_tasks` supports it directly, use it.
-        # Otherwise, limit is applied post-fetch if needed (as it is here)
-        tasks = await _fetch_all_from_paginator(client.get_tasks, **api_kwargs)
-        return _serialize_response(tasks)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    if invalid := _check_ids(project_id=project_id, section_id=section_id, parent_id=parent_id): return invalid
+    if ids and not all(_ID_MATCH(task_id) for task_id in ids): return _INVALID_ID_REPLIES["ids"]
+    client = await _get_or_init_client(ctx, "get_tasks")
+    if ids:
+        # The SDK sends ids as one comma-joined query parameter, so the whole set comes back from a
+        # single request (per 200 IDs). Drop duplicates so they don't inflate it or split the cache.
+        ids = list(dict.fromkeys(ids))
+
+    api_kwargs = _drop_none(
+        project_id=project_id, section_id=section_id, parent_id=parent_id,
+        label=label, ids=ids
+    )
+    logger.debug("Tool 'get_tasks' called with kwargs=%s, limit=%s", api_kwargs, limit)
+    # limit caps the total: paging stops once that many tasks are in hand.
+    max_items = limit if limit is not None and limit >= 0 else None
+    lifespan_ctx = _lifespan(ctx)
+    tasks_cache: TTLCache = lifespan_ctx.tasks_cache
+    cache_key = _tasks_cache_key(_drop_none(**api_kwargs, limit=max_items))
+    cached_response = tasks_cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response
+    generation = lifespan_ctx.tasks_generation
+
+    tasks = await _cached_read(ctx, ("tasks", cache_key),
+                               lambda: _fetch_all_from_paginator(ctx, client.get_tasks, max_items, **api_kwargs), store=False)
+    response = _serialize_response(tasks)
+    # A task mutation during the fetch may have made this list stale: return it, but don't cache it.
+    if lifespan_ctx.tasks_generation == generation:
+        tasks_cache[cache_key] = response
+    return response
 
 @mcp.tool()
+@_tool_errors()
 async def filter_tasks(
     ctx: Context,
     query: Optional[str] = None,
@@ -274,25 +660,17 @@ async def filter_tasks(
     limit: Optional[int] = None
 ) -> str:
     """Get active tasks matching the filter query."""
-    tool_name = "filter_tasks"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        api_kwargs = _prepare_api_kwargs(query=query, lang=lang, limit=limit) # SDK `filter_tasks` might take `filter` instead of `query`
-        print(f"Tool '{tool_name}' called with kwargs={api_kwargs}", file=sys.stderr)
-        # Assuming client.filter_tasks maps to client.get_tasks(filter=query, lang=lang, limit=limit)
-        # or a similar mechanism. If the SDK uses 'filter' for the query string:
-        sdk_filter_kwargs = {'filter': query}
-        if lang: sdk_filter_kwargs['lang'] = lang
-        if limit: sdk_filter_kwargs['limit'] = limit # This limit might be for pagination page size
-        
-        tasks = await _fetch_all_from_paginator(client.get_tasks, **_prepare_api_kwargs(**sdk_filter_kwargs))
-        return _serialize_response(tasks)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    client = await _get_or_init_client(ctx, "filter_tasks")
+    api_kwargs = _drop_none(query=query, lang=lang)
+    logger.debug("Tool 'filter_tasks' called with kwargs=%s, limit=%s", api_kwargs, limit)
+    # get_tasks takes no filter argument; filtering has its own paginated endpoint.
+    max_items = limit if limit is not None and limit >= 0 else None
+    tasks = await _fetch_all_from_paginator(ctx, client.filter_tasks, max_items, **api_kwargs)
+    return _serialize_response(tasks)
 
 
 @mcp.tool()
+@_tool_errors()
 async def add_task_quick(
     ctx: Context,
     text: str,
@@ -301,18 +679,24 @@ async def add_task_quick(
     auto_reminder: bool = True
 ) -> str:
     """Create a new task using Todoist's Quick Add syntax."""
-    tool_name = "add_task_quick"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        api_kwargs = _prepare_api_kwargs(note=note, reminder=reminder, auto_reminder=auto_reminder)
-        print(f"Tool '{tool_name}' called with text='{text}', kwargs={api_kwargs}", file=sys.stderr)
-        task = await asyncio.to_thread(client.add_task_quick, text=text, **api_kwargs) # type: ignore
-        return _serialize_response(task)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    client = await _get_or_init_client(ctx, "add_task_quick")
+    api_kwargs = _drop_none(note=note, reminder=reminder, auto_reminder=auto_reminder)
+    logger.debug("Tool 'add_task_quick' called with text='%s', kwargs=%s", text, api_kwargs)
+    task = await _run_sdk(ctx, client.add_task_quick, text=text, **api_kwargs) # type: ignore
+    _invalidate_tasks_cache(ctx)
+    if "@" in text:
+        _invalidate_read_cache(ctx, "shared_labels")
+    return _serialize_response(task)
+
+# Optional update_task parameters forwarded to the SDK when provided.
+_UPDATE_TASK_FIELDS = (
+    "content", "description", "labels", "priority", "due_string", "due_lang",
+    "due_date", "due_datetime", "assignee_id", "day_order", "collapsed",
+    "duration", "duration_unit", "deadline_date", "deadline_lang",
+)
 
 @mcp.tool()
+@_tool_errors("task_id")
 async def update_task(
     ctx: Context,
     task_id: str,
@@ -333,99 +717,121 @@ async def update_task(
     deadline_lang: Optional[str] = None
 ) -> str:
     """Update an existing task."""
-    tool_name = "update_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        api_kwargs = _prepare_api_kwargs(
-            content=content, description=description, labels=labels, priority=priority,
-            due_string=due_string, due_lang=due_lang, due_date=due_date, due_datetime=due_datetime,
-            assignee_id=assignee_id, day_order=day_order, collapsed=collapsed, duration=duration,
-            duration_unit=duration_unit, deadline_date=deadline_date, deadline_lang=deadline_lang
-        )
-        print(f"Tool '{tool_name}' called for task_id='{task_id}' with kwargs={api_kwargs}", file=sys.stderr)
-        success = await asyncio.to_thread(client.update_task, task_id=task_id, **api_kwargs) # type: ignore
-        if success:
-            updated_task = await asyncio.to_thread(client.get_task, task_id=task_id) # type: ignore
-            return _serialize_response(updated_task)
-        return _serialize_response({"status": "failed", "message": "Update operation did not report success."})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, task_id)
+    params = locals()
+    if not _ID_MATCH(task_id): return _INVALID_TASK_ID
+    client = await _get_or_init_client(ctx, "update_task")
+
+    # Same single pass as add_task: no intermediate kwargs dict.
+    api_kwargs = {k: _parse_api_value(k, v) for k in _UPDATE_TASK_FIELDS if (v := params[k]) is not None}
+    logger.debug("Tool 'update_task' called for task_id='%s' with kwargs=%s", task_id, api_kwargs)
+    # The SDK returns the updated task, so no follow-up get_task is needed.
+    updated_task = await _run_sdk(ctx, client.update_task, task_id=task_id, **api_kwargs) # type: ignore
+    _invalidate_tasks_cache(ctx)
+    if labels:
+        _invalidate_read_cache(ctx, "shared_labels")
+    return _serialize_response(updated_task)
 
 @mcp.tool()
+@_tool_errors("task_id")
 async def complete_task(ctx: Context, task_id: str) -> str:
-    """Complete a task. (Corresponds to 'close_task' in SDK v2+)"""
-    tool_name = "complete_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' (close_task) called for task_id='{task_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.close_task, task_id=task_id) # type: ignore
-        return _serialize_response({"success": success, "task_id": task_id, "action": "completed"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, task_id)
+    """Complete a task. (Corresponds to 'complete_task' in SDK v3; 'close_task' in v2)"""
+    if not _ID_MATCH(task_id): return _INVALID_TASK_ID
+    client = await _get_or_init_client(ctx, "complete_task")
+    logger.debug("Tool 'complete_task' called for task_id='%s'", task_id)
+    success = await _run_sdk(ctx, client.complete_task, task_id=task_id) # type: ignore
+    _invalidate_tasks_cache(ctx)
+    if success:
+        return _TASK_COMPLETED(task_id)
+    return _serialize_response({"success": success, "task_id": task_id, "action": "completed"})
 
 @mcp.tool()
+@_tool_errors()
+async def complete_tasks(ctx: Context, task_ids: List[str]) -> str:
+    """Complete several tasks at once. Requests run concurrently; each task reports its own result."""
+    client = await _get_or_init_client(ctx, "complete_tasks")
+    logger.debug("Tool 'complete_tasks' called for task_ids=%s", task_ids)
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    async def complete_one(task_id: str) -> dict[str, Any]:
+        if not _ID_MATCH(task_id):
+            return {"success": False, "task_id": task_id, "error": "Invalid task_id"}
+        async with semaphore:
+            try:
+                success = await _run_sdk(ctx, client.complete_task, task_id=task_id) # type: ignore
+                return {"success": success, "task_id": task_id, "action": "completed"}
+            except Exception as e:
+                logger.error("Error in complete_tasks for item %s: %s", task_id, e)
+                return {"success": False, "task_id": task_id, "error": str(e)}
+
+    # A failure must not cancel the siblings: the caller needs to know which tasks were completed.
+    results = await asyncio.gather(*(complete_one(task_id) for task_id in task_ids))
+    _invalidate_tasks_cache(ctx)
+    return _serialize_response(results)
+
+@mcp.tool()
+@_tool_errors("task_id")
 async def uncomplete_task(ctx: Context, task_id: str) -> str:
-    """Uncomplete a (completed) task. (Corresponds to 'reopen_task' in SDK v2+)"""
-    tool_name = "uncomplete_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' (reopen_task) called for task_id='{task_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.reopen_task, task_id=task_id) # type: ignore
-        return _serialize_response({"success": success, "task_id": task_id, "action": "reopened"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, task_id)
+    """Uncomplete a (completed) task. (Corresponds to 'uncomplete_task' in SDK v3; 'reopen_task' in v2)"""
+    if not _ID_MATCH(task_id): return _INVALID_TASK_ID
+    client = await _get_or_init_client(ctx, "uncomplete_task")
+    logger.debug("Tool 'uncomplete_task' called for task_id='%s'", task_id)
+    success = await _run_sdk(ctx, client.uncomplete_task, task_id=task_id) # type: ignore
+    _invalidate_tasks_cache(ctx)
+    if success:
+        return _TASK_REOPENED(task_id)
+    return _serialize_response({"success": success, "task_id": task_id, "action": "reopened"})
 
 @mcp.tool()
+@_tool_errors("task_id")
 async def move_task(
     ctx: Context,
     task_id: str,
     project_id: Optional[str] = None,
     section_id: Optional[str] = None,
-    parent_id: Optional[str] = None 
+    parent_id: Optional[str] = None,
+    return_updated: bool = True
 ) -> str:
-    """Move a task to a different project or section. (parent_id might need update_task)"""
-    tool_name = "move_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        if project_id is None and section_id is None and parent_id is None: # Adjusted condition
-            return _serialize_response({"error": "Either project_id, section_id or parent_id must be provided for move_task (uses update_task)." })
-
-        # Use update_task for moving, including parent_id
-        api_kwargs = _prepare_api_kwargs(project_id=project_id, section_id=section_id, parent_id=parent_id)
-        
-        if not api_kwargs:
-             return _serialize_response({"error": "No move parameters provided."})
-
-        print(f"Tool '{tool_name}' (via update_task) called for task_id='{task_id}' with kwargs={api_kwargs}", file=sys.stderr)
-        success = await asyncio.to_thread(client.update_task, task_id=task_id, **api_kwargs) # type: ignore
-        if success:
-            moved_task = await asyncio.to_thread(client.get_task, task_id=task_id) # type: ignore
-            return _serialize_response(moved_task)
-        return _serialize_response({"status": "failed", "message": "Move operation (via update_task) did not report success."})
+    """Move a task to a different project, section or parent task. Set return_updated=False to skip fetching the moved task."""
+    if not _ID_MATCH(task_id): return _INVALID_TASK_ID
+    if invalid := _check_ids(project_id=project_id, section_id=section_id, parent_id=parent_id): return invalid
+    client = await _get_or_init_client(ctx, "move_task")
+
+    if project_id is None and section_id is None and parent_id is None: # Adjusted condition
+        return _ERR_MOVE_NEEDS_TARGET
+
+    api_kwargs = _drop_none(project_id=project_id, section_id=section_id, parent_id=parent_id)
+
+    if not api_kwargs:
+         return _ERR_MOVE_NO_PARAMS
+
+    logger.debug("Tool 'move_task' called for task_id='%s' with kwargs=%s", task_id, api_kwargs)
+    success = await _run_sdk(ctx, client.move_task, task_id=task_id, **api_kwargs) # type: ignore
+    _invalidate_tasks_cache(ctx)
+    if not success:
+        return _ERR_MOVE_FAILED
+    if not return_updated:
+        return _serialize_response({"success": True, "task_id": task_id, "action": "moved"})
+    # The move endpoint only reports success, so the task is fetched to return its new state.
+    moved_task = await _run_sdk(ctx, client.get_task, task_id=task_id) # type: ignore
+    return _serialize_response(moved_task)
 
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, task_id)
 
 @mcp.tool()
+@_tool_errors("task_id")
 async def delete_task(ctx: Context, task_id: str) -> str:
     """Delete a task."""
-    tool_name = "delete_task"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for task_id='{task_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.delete_task, task_id=task_id) # type: ignore
-        return _serialize_response({"success": success, "task_id": task_id, "action": "deleted"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, task_id)
+    if not _ID_MATCH(task_id): return _INVALID_TASK_ID
+    client = await _get_or_init_client(ctx, "delete_task")
+    logger.debug("Tool 'delete_task' called for task_id='%s'", task_id)
+    success = await _run_sdk(ctx, client.delete_task, task_id=task_id) # type: ignore
+    _invalidate_read_cache(ctx, "comment", "comments")
+    _invalidate_tasks_cache(ctx)
+    if success:
+        return _TASK_DELETED(task_id)
+    return _serialize_response({"success": success, "task_id": task_id, "action": "deleted"})
 
 @mcp.tool()
+@_tool_errors()
 async def get_completed_tasks_by_due_date(
     ctx: Context,
     since: str, 
@@ -433,29 +839,18 @@ async def get_completed_tasks_by_due_date(
     project_id: Optional[str] = None,
     limit: Optional[int] = None
 ) -> str:
-    """Get completed tasks within a due date range using filters."""
-    tool_name = "get_completed_tasks_by_due_date"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-
-        # Convert since/until to YYYY-MM-DD format if not already
-        parsed_since = date.fromisoformat(since.split("T")[0]).strftime("%Y-%m-%d")
-        parsed_until = date.fromisoformat(until.split("T")[0]).strftime("%Y-%m-%d")
-
-        filter_str = f"all & (due after: {parsed_since} & due before: {parsed_until})"
-        if project_id:
-            filter_str += f" & project.id:{project_id}"
-        
-        api_kwargs = _prepare_api_kwargs(filter=filter_str, limit=limit)
-        print(f"Tool '{tool_name}' called with filter='{filter_str}', limit={limit}", file=sys.stderr)
-        
-        tasks = await _fetch_all_from_paginator(client.get_tasks, **api_kwargs) # type: ignore
-        return _serialize_response(tasks)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    """Get completed tasks whose due date falls within [since, until] (ISO dates or datetimes)."""
+    since_dt, until_dt = _parse_date_range(since, until)
+    client = await _get_or_init_client(ctx, "get_completed_tasks_by_due_date")
+
+    api_kwargs = _drop_none(since=since_dt, until=until_dt, project_id=project_id)
+    logger.debug("Tool 'get_completed_tasks_by_due_date' called with kwargs=%s, limit=%s", api_kwargs, limit)
+    max_items = limit if limit is not None and limit >= 0 else None
+    tasks = await _fetch_all_from_paginator(ctx, client.get_completed_tasks_by_due_date, max_items, **api_kwargs) # type: ignore
+    return _serialize_response(tasks)
 
 @mcp.tool()
+@_tool_errors()
 async def get_completed_tasks_by_completion_date(
     ctx: Context,
     since: str, 
@@ -463,31 +858,26 @@ async def get_completed_tasks_by_completion_date(
     project_id: Optional[str] = None,
     limit: Optional[int] = None
 ) -> str:
-    """Get completed tasks within a completion date range using filters."""
-    tool_name = "get_completed_tasks_by_completion_date"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-
-        # Convert since/until to YYYY-MM-DD format if not already
-        parsed_since = date.fromisoformat(since.split("T")[0]).strftime("%Y-%m-%d")
-        parsed_until = date.fromisoformat(until.split("T")[0]).strftime("%Y-%m-%d")
-
-        filter_str = f"all & (completed after: {parsed_since} & completed before: {parsed_until})"
-        if project_id:
-            filter_str += f" & project.id:{project_id}"
-            
-        api_kwargs = _prepare_api_kwargs(filter=filter_str, limit=limit)
-        print(f"Tool '{tool_name}' called with filter='{filter_str}', limit={limit}", file=sys.stderr)
-        
-        tasks = await _fetch_all_from_paginator(client.get_tasks, **api_kwargs) # type: ignore
-        return _serialize_response(tasks)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    """Get tasks completed within [since, until] (ISO dates or datetimes)."""
+    since_dt, until_dt = _parse_date_range(since, until)
+    client = await _get_or_init_client(ctx, "get_completed_tasks_by_completion_date")
+
+    logger.debug("Tool 'get_completed_tasks_by_completion_date' called with since=%s, until=%s, project_id=%s, limit=%s", since_dt, until_dt, project_id, limit)
+    max_items = limit if limit is not None and limit >= 0 else None
+    if project_id is None:
+        tasks = await _fetch_all_from_paginator(ctx, client.get_completed_tasks_by_completion_date, max_items,
+                                                since=since_dt, until=until_dt) # type: ignore
+    else:
+        # This endpoint has no project parameter, so the range is fetched in full and filtered here.
+        tasks = await _fetch_all_from_paginator(ctx, client.get_completed_tasks_by_completion_date,
+                                                since=since_dt, until=until_dt) # type: ignore
+        tasks = [t for t in tasks if t.project_id == project_id][:max_items]
+    return _serialize_response(tasks)
 
 
 # --- Project Functions ---
 @mcp.tool()
+@_tool_errors()
 async def add_project(
     ctx: Context,
     name: str,
@@ -498,52 +888,34 @@ async def add_project(
     view_style: Optional[Literal["list", "board"]] = None
 ) -> str:
     """Create a new project."""
-    tool_name = "add_project"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        api_kwargs = _prepare_api_kwargs(
-            description=description, parent_id=parent_id, color=color,
-            is_favorite=is_favorite, view_style=view_style
-        )
-        print(f"Tool '{tool_name}' called with name='{name}', kwargs={api_kwargs}", file=sys.stderr)
-        project = await asyncio.to_thread(client.add_project, name=name, **api_kwargs) # type: ignore
-        return _serialize_response(project)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    if invalid := _check_ids(parent_id=parent_id): return invalid
+    api_kwargs = _drop_none(
+        description=description, parent_id=parent_id, color=color,
+        is_favorite=is_favorite, view_style=view_style
+    )
+    return await _dispatch_write(ctx, "add_project", ("project", "projects"), name=name, **api_kwargs)
 
 @mcp.tool()
+@_tool_errors("project_id")
 async def get_project(ctx: Context, project_id: str) -> str:
     """Get a project by its ID."""
-    tool_name = "get_project"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called with project_id='{project_id}'", file=sys.stderr)
-        project = await asyncio.to_thread(client.get_project, project_id=project_id) # type: ignore
-        return _serialize_response(project)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, project_id)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    return await _dispatch_read(ctx, "get_project", ("project", project_id), store=False, project_id=project_id)
 
 @mcp.tool()
+@_tool_errors()
 async def get_projects(ctx: Context, limit: Optional[int] = None) -> str:
     """Get all active projects."""
-    tool_name = "get_projects"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        sdk_call_kwargs = {} 
-        print(f"Tool '{tool_name}' called (limit: {limit})", file=sys.stderr)
-        all_projects = await _fetch_all_from_paginator(client.get_projects, **sdk_call_kwargs) # type: ignore
-        
-        final_projects_list = all_projects[:limit] if limit is not None and limit >= 0 else all_projects
-        return _serialize_response(final_projects_list)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    client = await _get_or_init_client(ctx, "get_projects")
+
+    logger.debug("Tool 'get_projects' called (limit: %s)", limit)
+    max_items = limit if limit is not None and limit >= 0 else None
+    projects = await _cached_read(ctx, ("projects", max_items),
+                                  lambda: _fetch_all_from_paginator(ctx, client.get_projects, max_items), store=False) # type: ignore
+    return _serialize_response(projects)
 
 @mcp.tool()
+@_tool_errors("project_id")
 async def update_project(
     ctx: Context,
     project_id: str,
@@ -554,82 +926,67 @@ async def update_project(
     view_style: Optional[Literal["list", "board"]] = None
 ) -> str:
     """Update an existing project."""
-    tool_name = "update_project"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        api_kwargs = _prepare_api_kwargs(
-            name=name, description=description, color=color,
-            is_favorite=is_favorite, view_style=view_style
-        )
-        print(f"Tool '{tool_name}' called for project_id='{project_id}' with kwargs={api_kwargs}", file=sys.stderr)
-        success = await asyncio.to_thread(client.update_project, project_id=project_id, **api_kwargs) # type: ignore
-        if success:
-            updated_project = await asyncio.to_thread(client.get_project, project_id=project_id) # type: ignore
-            return _serialize_response(updated_project)
-        return _serialize_response({"status": "failed", "message": "Update project operation did not report success."})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, project_id)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    api_kwargs = _drop_none(
+        name=name, description=description, color=color,
+        is_favorite=is_favorite, view_style=view_style
+    )
+    return await _dispatch_write(ctx, "update_project", ("project", "projects"),
+                                 project_id=project_id, **api_kwargs)
 
 @mcp.tool()
+@_tool_errors("project_id")
 async def archive_project(ctx: Context, project_id: str) -> str:
     """Archive a project."""
-    tool_name = "archive_project"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for project_id='{project_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.archive_project, project_id=project_id) # type: ignore
-        return _serialize_response({"success": success, "project_id": project_id, "action": "archived"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, project_id)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    client = await _get_or_init_client(ctx, "archive_project")
+    logger.debug("Tool 'archive_project' called for project_id='%s'", project_id)
+    # Returns the archived Project; failures raise
+    await _run_sdk(ctx, client.archive_project, project_id=project_id) # type: ignore
+    _invalidate_read_cache(ctx, "project", "projects")
+    _invalidate_tasks_cache(ctx, project_id)
+    return _PROJECT_ARCHIVED(project_id)
 
 @mcp.tool()
+@_tool_errors("project_id")
 async def unarchive_project(ctx: Context, project_id: str) -> str:
     """Unarchive a project."""
-    tool_name = "unarchive_project"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for project_id='{project_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.unarchive_project, project_id=project_id) # type: ignore
-        return _serialize_response({"success": success, "project_id": project_id, "action": "unarchived"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, project_id)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    client = await _get_or_init_client(ctx, "unarchive_project")
+    logger.debug("Tool 'unarchive_project' called for project_id='%s'", project_id)
+    await _run_sdk(ctx, client.unarchive_project, project_id=project_id) # type: ignore
+    _invalidate_read_cache(ctx, "project", "projects")
+    _invalidate_tasks_cache(ctx, project_id)
+    return _PROJECT_UNARCHIVED(project_id)
 
 @mcp.tool()
+@_tool_errors("project_id")
 async def delete_project(ctx: Context, project_id: str) -> str:
     """Delete a project."""
-    tool_name = "delete_project"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for project_id='{project_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.delete_project, project_id=project_id) # type: ignore
-        return _serialize_response({"success": success, "project_id": project_id, "action": "deleted"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, project_id)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    client = await _get_or_init_client(ctx, "delete_project")
+    logger.debug("Tool 'delete_project' called for project_id='%s'", project_id)
+    success = await _run_sdk(ctx, client.delete_project, project_id=project_id) # type: ignore
+    _invalidate_read_cache(ctx, "project", "projects", "section", "sections", "comment", "comments")
+    _invalidate_tasks_cache(ctx, project_id)
+    return _serialize_response({"success": success, "project_id": project_id, "action": "deleted"})
 
 @mcp.tool()
+@_tool_errors("project_id")
 async def get_collaborators(ctx: Context, project_id: str, limit: Optional[int] = None) -> str:
     """Get collaborators in a shared project."""
-    tool_name = "get_collaborators"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for project_id='{project_id}'", file=sys.stderr)
-        # client.get_collaborators does not typically support pagination or limit directly.
-        collaborators = await asyncio.to_thread(client.get_collaborators, project_id=project_id) # type: ignore
-        
-        # Apply limit post-fetch if provided, as SDK might not support it.
-        final_collaborators = collaborators[:limit] if limit is not None and limit >= 0 else collaborators
-        return _serialize_response(final_collaborators)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, project_id)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    client = await _get_or_init_client(ctx, "get_collaborators")
+    logger.debug("Tool 'get_collaborators' called for project_id='%s'", project_id)
+    # get_collaborators returns a paginator like the other list calls
+    max_items = limit if limit is not None and limit >= 0 else None
+    collaborators = await _cached_read(ctx, ("collaborators", project_id, max_items),
+                                       lambda: _fetch_all_from_paginator(ctx, client.get_collaborators, max_items, project_id=project_id), store=False) # type: ignore
+    return _serialize_response(collaborators)
 
 # --- Section Functions ---
 @mcp.tool()
+@_tool_errors()
 async def add_section(
     ctx: Context,
     name: str,
@@ -637,86 +994,60 @@ async def add_section(
     order: Optional[int] = None
 ) -> str:
     """Create a new section within a project."""
-    tool_name = "add_section"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        api_kwargs = _prepare_api_kwargs(order=order)
-        print(f"Tool '{tool_name}' called with name='{name}', project_id='{project_id}', kwargs={api_kwargs}", file=sys.stderr)
-        section = await asyncio.to_thread(client.add_section, name=name, project_id=project_id, **api_kwargs) # type: ignore
-        return _serialize_response(section)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    if not _ID_MATCH(project_id): return _INVALID_PROJECT_ID
+    return await _dispatch_write(ctx, "add_section", ("section", "sections"),
+                                 name=name, project_id=project_id, **_drop_none(order=order))
 
 @mcp.tool()
+@_tool_errors("section_id")
 async def get_section(ctx: Context, section_id: str) -> str:
     """Get a specific section by its ID."""
-    tool_name = "get_section"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called with section_id='{section_id}'", file=sys.stderr)
-        section = await asyncio.to_thread(client.get_section, section_id=section_id) # type: ignore
-        return _serialize_response(section)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, section_id)
+    if not _ID_MATCH(section_id): return _INVALID_SECTION_ID
+    return await _dispatch_read(ctx, "get_section", ("section", section_id), section_id=section_id)
 
 @mcp.tool()
+@_tool_errors()
 async def get_sections(
     ctx: Context,
     project_id: Optional[str] = None,
     limit: Optional[int] = None
 ) -> str:
     """Get all active sections, optionally filtered by project_id."""
-    tool_name = "get_sections"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        sdk_call_kwargs = _prepare_api_kwargs(project_id=project_id) 
-        print(f"Tool '{tool_name}' called with sdk_kwargs={sdk_call_kwargs}, tool_limit={limit}", file=sys.stderr)
-        all_sections = await _fetch_all_from_paginator(client.get_sections, **sdk_call_kwargs) # type: ignore
-        
-        final_sections_list = all_sections[:limit] if limit is not None and limit >= 0 else all_sections
-        return _serialize_response(final_sections_list)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    if invalid := _check_ids(project_id=project_id): return invalid
+    client = await _get_or_init_client(ctx, "get_sections")
+
+    sdk_call_kwargs = _drop_none(project_id=project_id) 
+    logger.debug("Tool 'get_sections' called with sdk_kwargs=%s, tool_limit=%s", sdk_call_kwargs, limit)
+    max_items = limit if limit is not None and limit >= 0 else None
+    sections = await _cached_read(ctx, ("sections", project_id, max_items),
+                                  lambda: _fetch_all_from_paginator(ctx, client.get_sections, max_items, **sdk_call_kwargs)) # type: ignore
+    return _serialize_response(sections)
 
 @mcp.tool()
+@_tool_errors("section_id")
 async def update_section(
     ctx: Context,
     section_id: str,
     name: str
 ) -> str:
     """Update an existing section's name."""
-    tool_name = "update_section"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for section_id='{section_id}' with name='{name}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.update_section, section_id=section_id, name=name) # type: ignore
-        if success:
-            updated_section = await asyncio.to_thread(client.get_section, section_id=section_id) # type: ignore
-            return _serialize_response(updated_section)
-        return _serialize_response({"status": "failed", "message": "Update section operation did not report success."})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, section_id)
+    if not _ID_MATCH(section_id): return _INVALID_SECTION_ID
+    return await _dispatch_write(ctx, "update_section", ("section", "sections"),
+                                 store_key=("section", section_id),
+                                 section_id=section_id, name=name)
 
 @mcp.tool()
+@_tool_errors("section_id")
 async def delete_section(ctx: Context, section_id: str) -> str:
     """Delete a section."""
-    tool_name = "delete_section"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for section_id='{section_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.delete_section, section_id=section_id) # type: ignore
-        return _serialize_response({"success": success, "section_id": section_id, "action": "deleted"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, section_id)
+    if not _ID_MATCH(section_id): return _INVALID_SECTION_ID
+    reply = await _dispatch_delete(ctx, "delete_section", "section_id", section_id, ("section", "sections"))
+    _invalidate_tasks_cache(ctx) # The section's tasks are deleted with it
+    return reply
 
 # --- Label Functions ---
 @mcp.tool()
+@_tool_errors()
 async def add_label(
     ctx: Context,
     name: str,
@@ -725,48 +1056,30 @@ async def add_label(
     is_favorite: Optional[bool] = None
 ) -> str:
     """Create a new personal label."""
-    tool_name = "add_label"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        api_kwargs = _prepare_api_kwargs(color=color, item_order=item_order, is_favorite=is_favorite)
-        print(f"Tool '{tool_name}' called with name='{name}', kwargs={api_kwargs}", file=sys.stderr)
-        label = await asyncio.to_thread(client.add_label, name=name, **api_kwargs) # type: ignore
-        return _serialize_response(label)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    api_kwargs = _drop_none(color=color, item_order=item_order, is_favorite=is_favorite)
+    return await _dispatch_write(ctx, "add_label", ("label", "labels"), name=name, **api_kwargs)
 
 @mcp.tool()
+@_tool_errors("label_id")
 async def get_label(ctx: Context, label_id: str) -> str:
     """Get a specific personal label by its ID."""
-    tool_name = "get_label"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called with label_id='{label_id}'", file=sys.stderr)
-        label = await asyncio.to_thread(client.get_label, label_id=label_id) # type: ignore
-        return _serialize_response(label)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, label_id)
+    if not _ID_MATCH(label_id): return _INVALID_LABEL_ID
+    return await _dispatch_read(ctx, "get_label", ("label", label_id), label_id=label_id)
 
 @mcp.tool()
+@_tool_errors()
 async def get_labels(ctx: Context, limit: Optional[int] = None) -> str:
     """Get all personal labels."""
-    tool_name = "get_labels"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        
-        sdk_call_kwargs = {}
-        print(f"Tool '{tool_name}' called (limit: {limit})", file=sys.stderr)
-        all_labels = await _fetch_all_from_paginator(client.get_labels, **sdk_call_kwargs) # type: ignore
-        
-        final_labels_list = all_labels[:limit] if limit is not None and limit >= 0 else all_labels
-        return _serialize_response(final_labels_list)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    client = await _get_or_init_client(ctx, "get_labels")
+
+    logger.debug("Tool 'get_labels' called (limit: %s)", limit)
+    max_items = limit if limit is not None and limit >= 0 else None
+    labels = await _cached_read(ctx, ("labels", max_items),
+                                lambda: _fetch_all_from_paginator(ctx, client.get_labels, max_items)) # type: ignore
+    return _serialize_response(labels)
 
 @mcp.tool()
+@_tool_errors("label_id")
 async def update_label(
     ctx: Context,
     label_id: str,
@@ -776,125 +1089,76 @@ async def update_label(
     is_favorite: Optional[bool] = None
 ) -> str:
     """Update a personal label."""
-    tool_name = "update_label"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        api_kwargs = _prepare_api_kwargs(name=name, color=color, item_order=item_order, is_favorite=is_favorite)
-        print(f"Tool '{tool_name}' called for label_id='{label_id}' with kwargs={api_kwargs}", file=sys.stderr)
-        success = await asyncio.to_thread(client.update_label, label_id=label_id, **api_kwargs) # type: ignore
-        if success:
-            updated_label = await asyncio.to_thread(client.get_label, label_id=label_id) # type: ignore
-            return _serialize_response(updated_label)
-        return _serialize_response({"status": "failed", "message": "Update label operation did not report success."})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, label_id)
+    if not _ID_MATCH(label_id): return _INVALID_LABEL_ID
+    api_kwargs = _drop_none(name=name, color=color, item_order=item_order, is_favorite=is_favorite)
+    return await _dispatch_write(ctx, "update_label", ("label", "labels"),
+                                 store_key=("label", label_id),
+                                 label_id=label_id, **api_kwargs)
 
 @mcp.tool()
+@_tool_errors("label_id")
 async def delete_label(ctx: Context, label_id: str) -> str:
     """Delete a personal label."""
-    tool_name = "delete_label"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for label_id='{label_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.delete_label, label_id=label_id) # type: ignore
-        return _serialize_response({"success": success, "label_id": label_id, "action": "deleted"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, label_id)
+    if not _ID_MATCH(label_id): return _INVALID_LABEL_ID
+    return await _dispatch_delete(ctx, "delete_label", "label_id", label_id, ("label", "labels"))
 
 @mcp.tool()
+@_tool_errors()
 async def get_shared_labels(
     ctx: Context,
     omit_personal: bool = False, 
     limit: Optional[int] = None
 ) -> str:
-    """Get shared label names or Label objects (SDK v2+)."""
-    tool_name = "get_shared_labels"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-            
-        print(f"Tool '{tool_name}' called with omit_personal={omit_personal}, limit={limit}", file=sys.stderr)
-        
-        all_labels_list = await _fetch_all_from_paginator(client.get_labels) # type: ignore
-        
-        processed_shared_labels: List[Label] = []
-        for label_obj in all_labels_list:
-            if label_obj.is_shared:
-                if omit_personal:
-                    # A shared label is "personal" if it's also a favorite.
-                    # So, if omit_personal is True, we exclude shared labels that are also favorites.
-                    if not label_obj.is_favorite:
-                        processed_shared_labels.append(label_obj)
-                else: # include all shared labels
-                    processed_shared_labels.append(label_obj)
-        
-        final_shared_labels_data = processed_shared_labels[:limit] if limit is not None and limit >=0 else processed_shared_labels
-        return _serialize_response(final_shared_labels_data) 
-            
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    """Get the names of shared labels. omit_personal leaves out names that are also personal labels."""
+    client = await _get_or_init_client(ctx, "get_shared_labels")
+
+    logger.debug("Tool 'get_shared_labels' called with omit_personal=%s, limit=%s", omit_personal, limit)
+
+    # The API returns shared label names and applies omit_personal itself, so nothing is filtered here.
+    max_items = limit if limit is not None and limit >= 0 else None
+    shared_label_names = await _cached_read(ctx, ("shared_labels", omit_personal, max_items),
+                                            lambda: _fetch_all_from_paginator(ctx, client.get_shared_labels, max_items, omit_personal=omit_personal)) # type: ignore
+    return _serialize_response(shared_label_names)
+
 
 @mcp.tool()
+@_tool_errors()
 async def rename_shared_label(
     ctx: Context,
     name: str, # Old name
     new_name: str
 ) -> str:
-    """Rename all occurrences of a shared label. (SDK v2: update label by ID)"""
-    tool_name = "rename_shared_label"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-            
-        print(f"Tool '{tool_name}' called for name='{name}' to new_name='{new_name}'", file=sys.stderr)
-        all_labels = await asyncio.to_thread(client.get_labels) # type: ignore
-        label_to_rename = None
-        for lbl in all_labels: # type: ignore
-            if lbl.name == name and lbl.is_shared:
-                label_to_rename = lbl
-                break
-        
-        if not label_to_rename:
-            return _serialize_response({"error": f"Shared label '{name}' not found."})
-        
-        success_update = await asyncio.to_thread(client.update_label, label_id=label_to_rename.id, name=new_name) # type: ignore
-        if success_update:
-            updated_label = await asyncio.to_thread(client.get_label, label_id=label_to_rename.id) # type: ignore
-            return _serialize_response(updated_label)
-        return _serialize_response({"status": "failed", "message": f"Failed to rename shared label '{name}'."})
+    """Rename all occurrences of a shared label.
+    Returns {"success": ..., "name": ..., "new_name": ..., "action": "renamed"}."""
+    client = await _get_or_init_client(ctx, "rename_shared_label")
+
+    logger.debug("Tool 'rename_shared_label' called for name='%s' to new_name='%s'", name, new_name)
+    # Shared labels are addressed by name, so no label listing is needed to find an ID.
+    success = await _run_sdk(ctx, client.rename_shared_label, name=name, new_name=new_name) # type: ignore
+    # Tasks carry labels by name, so cached tasks and label reads may still show the old one.
+    _invalidate_tasks_cache(ctx)
+    _invalidate_read_cache(ctx, "shared_labels", "label", "labels")
+    return _serialize_response({"success": success, "name": name, "new_name": new_name, "action": "renamed"})
 
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
 
 @mcp.tool()
+@_tool_errors()
 async def remove_shared_label(ctx: Context, name: str) -> str:
-    """Remove all occurrences of a shared label. (SDK v2: delete label by ID)"""
-    tool_name = "remove_shared_label"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-            
-        print(f"Tool '{tool_name}' called for name='{name}'", file=sys.stderr)
-        all_labels = await asyncio.to_thread(client.get_labels) # type: ignore
-        label_to_remove = None
-        for lbl in all_labels: # type: ignore
-            if lbl.name == name and lbl.is_shared:
-                label_to_remove = lbl
-                break
-        
-        if not label_to_remove:
-            return _serialize_response({"error": f"Shared label '{name}' not found to remove."})
-        
-        success_delete = await asyncio.to_thread(client.delete_label, label_id=label_to_remove.id) # type: ignore
-        return _serialize_response({"success": success_delete, "label_id": label_to_remove.id, "name": name, "action": "deleted"})
+    """Remove all occurrences of a shared label.
+    Returns {"success": ..., "name": ..., "action": "deleted"}."""
+    client = await _get_or_init_client(ctx, "remove_shared_label")
+
+    logger.debug("Tool 'remove_shared_label' called for name='%s'", name)
+    success = await _run_sdk(ctx, client.remove_shared_label, name=name) # type: ignore
+    # Tasks carry labels by name, so cached tasks and label reads may still show the removed one.
+    _invalidate_tasks_cache(ctx)
+    _invalidate_read_cache(ctx, "shared_labels", "label", "labels")
+    return _serialize_response({"success": success, "name": name, "action": "deleted"})
 
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
 
 # --- Comment Functions ---
 @mcp.tool()
+@_tool_errors()
 async def add_comment(
     ctx: Context,
     content: str,
@@ -907,49 +1171,36 @@ async def add_comment(
     uids_to_notify: Optional[List[str]] = None
 ) -> str:
     """Create a new comment on a task or project."""
-    tool_name = "add_comment"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-
-        if project_id is None and task_id is None:
-            return _serialize_response({"error": "Either project_id or task_id must be provided for add_comment."})
-
-        attachment_obj: Optional[dict] = None
-        if attachment_file_url: 
-            attachment_obj = {
-                "file_name": attachment_file_name,
-                "file_url": attachment_file_url,
-                "file_type": attachment_file_type,
-                "resource_type": attachment_resource_type or "file"
-            }
-
-        api_kwargs = _prepare_api_kwargs(
-            project_id=project_id, task_id=task_id, attachment=attachment_obj
-        )
-        if uids_to_notify:
-            print(f"Warning: uids_to_notify ({uids_to_notify}) might not be directly supported by SDK add_comment. Consider @mentions in content.", file=sys.stderr)
-
-        print(f"Tool '{tool_name}' called with content='{content}', kwargs={api_kwargs}", file=sys.stderr)
-        comment = await asyncio.to_thread(client.add_comment, content=content, **api_kwargs) # type: ignore
-        return _serialize_response(comment)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    if project_id is None and task_id is None:
+        return _ERR_ADD_COMMENT_NEEDS_PARENT
+    if invalid := _check_ids(project_id=project_id, task_id=task_id): return invalid
+
+    attachment_obj: Optional[dict] = None
+    if attachment_file_url: 
+        attachment_obj = {
+            "file_name": attachment_file_name,
+            "file_url": attachment_file_url,
+            "file_type": attachment_file_type,
+            "resource_type": attachment_resource_type or "file"
+        }
+
+    api_kwargs = _drop_none(
+        project_id=project_id, task_id=task_id, attachment=attachment_obj
+    )
+    if uids_to_notify:
+        logger.warning("Warning: uids_to_notify (%s) might not be directly supported by SDK add_comment. Consider @mentions in content.", uids_to_notify)
+
+    return await _dispatch_write(ctx, "add_comment", ("comment", "comments"), content=content, **api_kwargs)
 
 @mcp.tool()
+@_tool_errors("comment_id")
 async def get_comment(ctx: Context, comment_id: str) -> str:
     """Get a specific comment by its ID."""
-    tool_name = "get_comment"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called with comment_id='{comment_id}'", file=sys.stderr)
-        comment = await asyncio.to_thread(client.get_comment, comment_id=comment_id) # type: ignore
-        return _serialize_response(comment)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, comment_id)
+    if not _ID_MATCH(comment_id): return _INVALID_COMMENT_ID
+    return await _dispatch_read(ctx, "get_comment", ("comment", comment_id), comment_id=comment_id)
 
 @mcp.tool()
+@_tool_errors()
 async def get_comments(
     ctx: Context,
     project_id: Optional[str] = None,
@@ -957,97 +1208,118 @@ async def get_comments(
     limit: Optional[int] = None
 ) -> str:
     """Get comments for a task or project."""
-    tool_name = "get_comments"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-
-        if project_id is None and task_id is None:
-            return _serialize_response({"error": "Either project_id or task_id must be provided for get_comments."})
-            
-        sdk_call_kwargs = {}
-        if task_id:
-            sdk_call_kwargs['task_id'] = task_id
-        elif project_id:
-            sdk_call_kwargs['project_id'] = project_id
-            
-        print(f"Tool '{tool_name}' called with sdk_kwargs={sdk_call_kwargs}, tool_limit={limit}", file=sys.stderr)
-        # SDK get_comments might not take limit directly for total items.
-        # _fetch_all_from_paginator handles pagination if client.get_comments uses it.
-        # If limit is for SDK's pagination page size, it's handled there.
-        # If client.get_comments takes a limit for total number of items, it should be passed directly.
-        # Current _fetch_all_from_paginator does not pass limit down to the SDK call.
-        # So, limit is applied post-fetch.
-        all_comments = await _fetch_all_from_paginator(client.get_comments, **sdk_call_kwargs) # type: ignore
-        
-        final_comments_list = all_comments[:limit] if limit is not None and limit >= 0 else all_comments
-        return _serialize_response(final_comments_list)
-    except Exception as e:
-        return _handle_tool_error(e, tool_name)
+    if invalid := _check_ids(project_id=project_id, task_id=task_id): return invalid
+    client = await _get_or_init_client(ctx, "get_comments")
+
+    if project_id is None and task_id is None:
+        return _ERR_GET_COMMENTS_NEEDS_PARENT
+
+    # task_id wins when both are given
+    sdk_call_kwargs = {"task_id": task_id} if task_id else {"project_id": project_id}
+    logger.debug("Tool 'get_comments' called with sdk_kwargs=%s, tool_limit=%s", sdk_call_kwargs, limit)
+    max_items = limit if limit is not None and limit >= 0 else None
+    comments = await _cached_read(ctx, ("comments", *sdk_call_kwargs.items(), max_items),
+                                  lambda: _fetch_all_from_paginator(ctx, client.get_comments, max_items, **sdk_call_kwargs)) # type: ignore
+    return _serialize_response(comments)
 
 @mcp.tool()
+@_tool_errors("comment_id")
 async def update_comment(
     ctx: Context,
     comment_id: str,
     content: str
 ) -> str:
     """Update an existing comment's content."""
-    tool_name = "update_comment"
-    try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for comment_id='{comment_id}' with new content.", file=sys.stderr)
-        success = await asyncio.to_thread(client.update_comment, comment_id=comment_id, content=content) # type: ignore
-        if success:
-            updated_comment = await asyncio.to_thread(client.get_comment, comment_id=comment_id) # type: ignore
-            return _serialize_response(updated_comment)
-        return _serialize_response({"status": "failed", "message": "Update comment operation did not report success."})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, comment_id)
+    if not _ID_MATCH(comment_id): return _INVALID_COMMENT_ID
+    return await _dispatch_write(ctx, "update_comment", ("comment", "comments"),
+                                 store_key=("comment", comment_id),
+                                 comment_id=comment_id, content=content)
 
 @mcp.tool()
+@_tool_errors("comment_id")
 async def delete_comment(ctx: Context, comment_id: str) -> str:
     """Delete a comment."""
-    tool_name = "delete_comment"
+    if not _ID_MATCH(comment_id): return _INVALID_COMMENT_ID
+    return await _dispatch_delete(ctx, "delete_comment", "comment_id", comment_id, ("comment", "comments"))
+
+
+class _StdoutToStderr:
+    """Stand-in for sys.stdout while serving over stdio.
+
+    The stdio transport writes JSON-RPC frames to sys.stdout.buffer; any other text
+    written to sys.stdout (a stray print, library output) would corrupt that stream
+    and drop the client connection, so it is sent to stderr instead.
+    """
+    def __init__(self, real_stdout: Any):
+        self.buffer = real_stdout.buffer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(sys.stderr, name)
+
+async def _run_stdio() -> None:
+    if not isinstance(sys.stdout, _StdoutToStderr):
+        sys.stdout = _StdoutToStderr(sys.stdout)
+    await mcp.run_stdio_async()
+
+# Caps open SSE connections so a burst of clients gets 503s instead of exhausting the worker
+SSE_UVICORN_CONFIG = {"limit_concurrency": 1024}
+
+
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when available; it is much faster than asyncio's for socket I/O (SSE)."""
+    if sys.platform == "win32":
+        return
     try:
-        client = await _get_or_init_client(ctx, tool_name)
-        if not client: return _serialize_response({"error": "Client could not be initialized."})
-        print(f"Tool '{tool_name}' called for comment_id='{comment_id}'", file=sys.stderr)
-        success = await asyncio.to_thread(client.delete_comment, comment_id=comment_id) # type: ignore
-        return _serialize_response({"success": success, "comment_id": comment_id, "action": "deleted"})
-    except Exception as e:
-        return _handle_tool_error(e, tool_name, comment_id)
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+async def _run_sse() -> None:
+    sse_host = os.getenv("MCP_HOST", "127.0.0.1") 
+    sse_port_str = os.getenv("MCP_PORT", "8080")  
+    try:
+        sse_port = int(sse_port_str)
+    except ValueError:
+        logger.warning("Warning: Invalid MCP_PORT value '%s'. Defaulting to 8080.", sse_port_str)
+        sse_port = 8080
+
+    logger.info("Attempting to run MCP server with SSE transport on %s:%s", sse_host, sse_port)
+    await mcp.run_sse_async(host=sse_host, port=sse_port, uvicorn_config=SSE_UVICORN_CONFIG)
 
+# TRANSPORT values and the coroutine serving each.
+_TRANSPORTS: dict[str, Callable[[], Awaitable[None]]] = {
+    "stdio": _run_stdio,
+    "sse": _run_sse,
+}
 
-# MODIFIED: main function for SSE host/port
 async def main():
     transport = os.getenv("TRANSPORT", "stdio") 
-    print(f"Starting Todoist MCP server with {transport} transport...", file=sys.stderr)
-
-    if transport == "stdio":
-        await mcp.run_stdio_async()
-    elif transport == "sse" or transport == "streamable_http":
-        if hasattr(mcp, "run_sse_async"):
-            sse_host = os.getenv("MCP_HOST", "127.0.0.1") 
-            sse_port_str = os.getenv("MCP_PORT", "8080")  
-            try:
-                sse_port = int(sse_port_str)
-            except ValueError:
-                print(f"Warning: Invalid MCP_PORT value '{sse_port_str}'. Defaulting to 8080.", file=sys.stderr)
-                sse_port = 8080
-            
-            print(f"Attempting to run MCP server with SSE transport on {sse_host}:{sse_port}", file=sys.stderr)
-            await mcp.run_sse_async(host=sse_host, port=sse_port)
-        else:
-            print("Error: mcp.run_sse_async() not found. SSE transport might not be supported by this FastMCP version or setup.", file=sys.stderr)
-            print("Falling back to STDIO transport as a last resort.", file=sys.stderr)
-            await mcp.run_stdio_async() 
-    else:
-        print(f"Error: Unknown transport '{transport}' specified. Supported transports: 'stdio', 'sse'. Defaulting to 'stdio'.", file=sys.stderr)
-        await mcp.run_stdio_async() 
+    logger.info("Starting Todoist MCP server with %s transport...", transport)
+
+    run_transport = _TRANSPORTS.get(transport)
+    if run_transport is None:
+        logger.error("Error: Unknown transport '%s' specified. Supported transports: %s. Defaulting to 'stdio'.",
+                     transport, ", ".join(f"'{name}'" for name in _TRANSPORTS))
+        run_transport = _run_stdio
+    await run_transport()
+
+def _run_main() -> None:
+    """Runs main() on an explicitly managed loop; SDK calls use the lifespan's own executor."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        asyncio.set_event_loop(None)
+        loop.close()
 
 
 if __name__ == "__main__":
-    print("Starting Todoist MCP server...", file=sys.stderr)
-    asyncio.run(main())
-    print("Todoist MCP server finished.", file=sys.stderr)
\ No newline at end of file
+    logger.info("Starting Todoist MCP server...")
+    _install_uvloop()
+    _run_main()
+    logger.info("Todoist MCP server finished.")
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""Shared fixtures: a session context and a recording stand-in for the Todoist SDK client."""
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("TODOIST_API_TOKEN", "test-token") # Keeps server from reading .env at import
+
+import server
+
+
+class FakeClient:
+    """Records every SDK call and returns a canned result per method name (default: True)."""
+
+    def __init__(self, **results):
+        self.calls = []
+        self.results = results
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, kwargs))
+            result = self.results.get(name, True)
+            return result(**kwargs) if callable(result) else result
+        return method
+
+
+def make_ctx(client=None):
+    """Returns (ctx, lifespan_ctx) the way FastMCP hands them to a tool, with client already initialized."""
+    lifespan_ctx = server.ToDoistContext(todoist_client=client if client is not None else FakeClient())
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context=lifespan_ctx)), lifespan_ctx
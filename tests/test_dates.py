@@ -0,0 +1,55 @@
+import unittest
+from datetime import date, datetime
+
+from tests.support import FakeClient, make_ctx
+import server
+
+
+class ParseApiValueTest(unittest.TestCase):
+    def test_parses_date_arguments(self):
+        self.assertEqual(server._parse_api_value("due_date", "2025-03-04"), date(2025, 3, 4))
+        self.assertEqual(server._parse_api_value("deadline_date", "2025-03-04"), date(2025, 3, 4))
+        self.assertEqual(server._parse_api_value("due_datetime", "2025-03-04T09:30:00"), datetime(2025, 3, 4, 9, 30))
+
+    def test_passes_other_values_through(self):
+        self.assertEqual(server._parse_api_value("due_date", "next monday"), "next monday") # The API reports it
+        self.assertEqual(server._parse_api_value("due_string", "2025-03-04"), "2025-03-04")
+        parsed = date(2025, 3, 4)
+        self.assertIs(server._parse_api_value("due_date", parsed), parsed)
+
+
+class DropNoneTest(unittest.TestCase):
+    def test_drops_only_none(self):
+        self.assertEqual(server._drop_none(a=None, b=0, c=False, d="", e=[]), {"b": 0, "c": False, "d": "", "e": []})
+
+    def test_leaves_date_strings_unparsed(self):
+        self.assertEqual(server._drop_none(due_date="2025-03-04"), {"due_date": "2025-03-04"})
+
+
+class ParseDateRangeTest(unittest.TestCase):
+    def test_date_only_until_covers_the_whole_day(self):
+        since, until = server._parse_date_range("2025-03-01", "2025-03-04")
+        self.assertEqual(since, datetime(2025, 3, 1))
+        self.assertEqual(until, datetime(2025, 3, 4, 23, 59, 59))
+
+    def test_datetime_until_is_kept(self):
+        _, until = server._parse_date_range("2025-03-01", "2025-03-04T12:00:00")
+        self.assertEqual(until, datetime(2025, 3, 4, 12))
+
+    def test_rejects_malformed_bounds(self):
+        with self.assertRaises(ValueError):
+            server._parse_date_range("yesterday", "2025-03-04")
+
+
+class AddTaskDatesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_sdk_receives_parsed_dates(self):
+        client = FakeClient()
+        ctx, _ = make_ctx(client)
+        await server.add_task(ctx, "t", due_date="2025-03-04", deadline_date="2025-03-05", priority=0)
+        self.assertEqual(client.calls, [("add_task", {
+            "content": "t", "due_date": date(2025, 3, 4), "deadline_date": date(2025, 3, 5), "priority": 0,
+        })])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+from unittest import mock
+
+from tests.support import FakeClient, make_ctx
+import server
+
+
+class IdMatchTest(unittest.TestCase):
+    def test_accepts_todoist_ids(self):
+        for value in ("6X7rM8997g3RQmvh", "2995104339", "a"):
+            self.assertTrue(server._ID_MATCH(value), value)
+
+    def test_rejects_malformed_ids(self):
+        for value in ("", " ", "12 34", "../tasks", "abc/def", "id-with-dash", "x" * 65, "123\n"):
+            self.assertFalse(server._ID_MATCH(value), repr(value))
+
+    def test_check_ids_reports_first_bad_argument(self):
+        self.assertIsNone(server._check_ids(project_id="123", section_id=None))
+        self.assertEqual(server._check_ids(project_id="123", section_id="a/b"), server._INVALID_SECTION_ID)
+        self.assertEqual(json.loads(server._check_ids(parent_id=""))["error"], "Invalid parent_id")
+
+
+class ToolIdValidationTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = FakeClient()
+        self.ctx, _ = make_ctx(self.client)
+
+    async def assertRejected(self, call, reply):
+        self.assertEqual(await call, reply)
+        self.assertEqual(self.client.calls, [], "no request may be sent for a malformed ID")
+
+    async def test_required_ids(self):
+        await self.assertRejected(server.get_task(self.ctx, task_id="a b"), server._INVALID_TASK_ID)
+        await self.assertRejected(server.get_project(self.ctx, project_id=""), server._INVALID_PROJECT_ID)
+        await self.assertRejected(server.delete_section(self.ctx, section_id="1/2"), server._INVALID_SECTION_ID)
+        await self.assertRejected(server.update_label(self.ctx, label_id="?", name="x"), server._INVALID_LABEL_ID)
+        await self.assertRejected(server.get_comment(self.ctx, comment_id=" "), server._INVALID_COMMENT_ID)
+        await self.assertRejected(server.add_section(self.ctx, name="s", project_id="p/1"), server._INVALID_PROJECT_ID)
+
+    async def test_optional_filters(self):
+        await self.assertRejected(server.get_tasks(self.ctx, section_id="../x"), server._INVALID_SECTION_ID)
+        await self.assertRejected(server.get_tasks(self.ctx, ids=["1", "2 3"]), server._INVALID_ID_REPLIES["ids"])
+        await self.assertRejected(server.add_task(self.ctx, content="c", parent_id="x y"), server._INVALID_ID_REPLIES["parent_id"])
+        await self.assertRejected(server.move_task(self.ctx, task_id="1", project_id="a&b"), server._INVALID_PROJECT_ID)
+        await self.assertRejected(server.get_sections(self.ctx, project_id="?"), server._INVALID_PROJECT_ID)
+        await self.assertRejected(server.get_comments(self.ctx, task_id="1 2"), server._INVALID_TASK_ID)
+        await self.assertRejected(server.add_comment(self.ctx, content="c", project_id="p/"), server._INVALID_PROJECT_ID)
+
+    async def test_batch_items(self):
+        tasks = [{"content": "a", "project_id": "bad id"}]
+        await self.assertRejected(server.add_tasks_batch(self.ctx, tasks=tasks), server._INVALID_PROJECT_ID)
+        tasks = [{"content": "a", "parent_id": "not-a-temp-id"}]
+        await self.assertRejected(server.add_tasks_batch(self.ctx, tasks=tasks), server._INVALID_ID_REPLIES["parent_id"])
+
+    async def test_batch_parent_may_name_a_temp_id(self):
+        tasks = [{"content": "a", "temp_id": "parent-1"}, {"content": "b", "parent_id": "parent-1"}]
+        commands = []
+        async def post(ctx, func, connection, batch):
+            commands.extend(batch)
+            return {}
+        with mock.patch.object(server, "_run_sdk", post):
+            await server.add_tasks_batch(self.ctx, tasks=tasks)
+        self.assertEqual(commands[1]["args"]["parent_id"], "parent-1")
+
+    async def test_complete_tasks_reports_bad_ids_per_item(self):
+        results = json.loads(await server.complete_tasks(self.ctx, task_ids=["1", "x y"]))
+        self.assertEqual(results[1], {"success": False, "task_id": "x y", "error": "Invalid task_id"})
+        self.assertEqual(self.client.calls, [("complete_task", {"task_id": "1"})])
+
+
+if __name__ == "__main__":
+    unittest.main()
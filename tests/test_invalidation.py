@@ -0,0 +1,79 @@
+import json
+import unittest
+from unittest import mock
+
+from tests.support import FakeClient, make_ctx
+import server
+
+_KINDS = (
+    "task", "tasks", "project", "projects", "section", "sections", "label", "labels",
+    "shared_labels", "comment", "comments", "collaborators",
+)
+_TASK_KINDS = ("task", "tasks")
+
+# (tool call, read-cache kinds it must drop, get_tasks entries it must drop: "all", a project ID or None)
+_MUTATIONS = [
+    (lambda ctx: server.add_task(ctx, "t", project_id="p1", labels=["x"]), _TASK_KINDS + ("shared_labels",), "p1"),
+    (lambda ctx: server.add_tasks_batch(ctx, [{"content": "t", "labels": ["x"]}]), _TASK_KINDS + ("shared_labels",), "all"),
+    (lambda ctx: server.add_task_quick(ctx, "buy @milk"), _TASK_KINDS + ("shared_labels",), "all"),
+    (lambda ctx: server.update_task(ctx, "1", labels=["x"]), _TASK_KINDS + ("shared_labels",), "all"),
+    (lambda ctx: server.complete_task(ctx, "1"), _TASK_KINDS, "all"),
+    (lambda ctx: server.complete_tasks(ctx, ["1", "2"]), _TASK_KINDS, "all"),
+    (lambda ctx: server.uncomplete_task(ctx, "1"), _TASK_KINDS, "all"),
+    (lambda ctx: server.move_task(ctx, "1", project_id="p2"), _TASK_KINDS, "all"),
+    (lambda ctx: server.delete_task(ctx, "1"), _TASK_KINDS + ("comment", "comments"), "all"),
+    (lambda ctx: server.add_project(ctx, "p"), ("project", "projects"), None),
+    (lambda ctx: server.update_project(ctx, "p1", name="p"), ("project", "projects"), None),
+    (lambda ctx: server.archive_project(ctx, "p1"), _TASK_KINDS + ("project", "projects"), "p1"),
+    (lambda ctx: server.unarchive_project(ctx, "p1"), _TASK_KINDS + ("project", "projects"), "p1"),
+    (lambda ctx: server.delete_project(ctx, "p1"),
+     _TASK_KINDS + ("project", "projects", "section", "sections", "comment", "comments"), "p1"),
+    (lambda ctx: server.add_section(ctx, "s", "p1"), ("section", "sections"), None),
+    (lambda ctx: server.update_section(ctx, "1", "s"), ("section", "sections"), None),
+    (lambda ctx: server.delete_section(ctx, "1"), _TASK_KINDS + ("section", "sections"), "all"),
+    (lambda ctx: server.add_label(ctx, "l"), ("label", "labels"), None),
+    (lambda ctx: server.update_label(ctx, "1", name="l"), ("label", "labels"), None),
+    (lambda ctx: server.delete_label(ctx, "1"), ("label", "labels"), None),
+    (lambda ctx: server.rename_shared_label(ctx, "a", "b"), _TASK_KINDS + ("shared_labels", "label", "labels"), "all"),
+    (lambda ctx: server.remove_shared_label(ctx, "a"), _TASK_KINDS + ("shared_labels", "label", "labels"), "all"),
+    (lambda ctx: server.add_comment(ctx, "c", task_id="1"), ("comment", "comments"), None),
+    (lambda ctx: server.update_comment(ctx, "1", "c"), ("comment", "comments"), None),
+    (lambda ctx: server.delete_comment(ctx, "1"), ("comment", "comments"), None),
+]
+
+
+_run_sdk = server._run_sdk
+
+async def _run_sdk_without_sync_api(ctx, func, *args, **kwargs):
+    """add_tasks_batch posts to the Sync API directly rather than through the client."""
+    if func is server._post_sync_commands:
+        return {}
+    return await _run_sdk(ctx, func, *args, **kwargs)
+
+
+class MutationInvalidationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_each_mutation_drops_what_it_changed(self):
+        for index, (call, dropped, tasks_scope) in enumerate(_MUTATIONS):
+            with self.subTest(index=index, dropped=dropped):
+                await self.check_mutation(call, dropped, tasks_scope)
+
+    async def check_mutation(self, call, dropped, tasks_scope):
+        ctx, lifespan_ctx = make_ctx(FakeClient())
+        for kind in _KINDS:
+            lifespan_ctx.read_cache[(kind, "seed")] = "stale"
+        for project_id in ("p1", "p2", None):
+            lifespan_ctx.tasks_cache[(project_id, ())] = "stale"
+
+        with mock.patch.object(server, "_run_sdk", _run_sdk_without_sync_api):
+            reply = await call(ctx)
+        self.assertNotIn("error", json.loads(reply) if reply.startswith("{") else {}, reply)
+
+        left = {kind for kind in _KINDS if (kind, "seed") in lifespan_ctx.read_cache}
+        self.assertEqual(left, set(_KINDS) - set(dropped), reply)
+        expected_tasks = {"all": set(), "p1": {"p2"}, None: {"p1", "p2", None}}[tasks_scope]
+        self.assertEqual({key[0] for key in lifespan_ctx.tasks_cache}, expected_tasks, reply)
+        self.assertEqual(lifespan_ctx.tasks_generation, 0 if tasks_scope is None else 1, reply)
+
+
+if __name__ == "__main__":
+    unittest.main()
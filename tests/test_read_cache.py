@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from tests.support import make_ctx
+import server
+
+
+class CachedReadTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ctx, self.lifespan_ctx = make_ctx()
+        self.fetches = 0
+        self.release = asyncio.Event()
+
+    async def fetch(self):
+        self.fetches += 1
+        await self.release.wait()
+        return {"id": "1", "fetch": self.fetches}
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        readers = [asyncio.create_task(server._cached_read(self.ctx, ("section", "1"), self.fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*readers)
+        self.assertEqual(self.fetches, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(self.lifespan_ctx.pending_reads, {})
+
+    async def test_hit_skips_fetch(self):
+        self.release.set()
+        first = await server._cached_read(self.ctx, ("section", "1"), self.fetch)
+        second = await server._cached_read(self.ctx, ("section", "1"), self.fetch)
+        self.assertIs(first, second)
+        self.assertEqual(self.fetches, 1)
+
+    async def test_invalidation_mid_fetch_skips_store(self):
+        reader = asyncio.create_task(server._cached_read(self.ctx, ("section", "1"), self.fetch))
+        await asyncio.sleep(0)
+        server._invalidate_read_cache(self.ctx, "section")
+        self.release.set()
+        await reader
+        self.assertNotIn(("section", "1"), self.lifespan_ctx.read_cache)
+        self.assertEqual(self.lifespan_ctx.pending_reads, {})
+
+    async def test_store_false_only_coalesces(self):
+        self.release.set()
+        await server._cached_read(self.ctx, ("shared_labels", None), self.fetch, store=False)
+        await server._cached_read(self.ctx, ("shared_labels", None), self.fetch, store=False)
+        self.assertEqual(self.fetches, 2)
+        self.assertEqual(len(self.lifespan_ctx.read_cache), 0)
+
+    async def test_fetch_error_reaches_waiters(self):
+        async def failing_fetch():
+            await self.release.wait()
+            raise RuntimeError("boom")
+        readers = [asyncio.create_task(server._cached_read(self.ctx, ("label", "1"), failing_fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*readers, return_exceptions=True)
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertEqual(self.lifespan_ctx.pending_reads, {})
+
+    async def test_cancelled_owner_does_not_cancel_waiters(self):
+        owner = asyncio.create_task(server._cached_read(self.ctx, ("comment", "1"), self.fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(server._cached_read(self.ctx, ("comment", "1"), self.fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        owner.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await owner
+        self.release.set()
+        results = await asyncio.gather(*waiters)
+        # The waiters fall back to one fresh shared fetch rather than failing with CancelledError.
+        self.assertEqual(self.fetches, 2)
+        self.assertTrue(all(r == {"id": "1", "fetch": 2} for r in results))
+        self.assertEqual(self.lifespan_ctx.read_cache[("comment", "1")], {"id": "1", "fetch": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
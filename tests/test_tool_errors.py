@@ -0,0 +1,42 @@
+import json
+import unittest
+
+from tests.support import FakeClient, make_ctx
+import server
+
+
+def _fail(**kwargs):
+    raise RuntimeError("404 Not Found")
+
+
+def _forbidden(**kwargs):
+    raise RuntimeError("403 Forbidden")
+
+
+class ToolErrorsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ctx, _ = make_ctx(FakeClient(get_task=_fail, get_tasks=_fail, delete_task=_forbidden))
+
+    async def test_reports_keyword_item_id(self):
+        with self.assertLogs(server.logger, "ERROR") as logs:
+            reply = json.loads(await server.get_task(self.ctx, task_id="123"))
+        self.assertEqual(reply, {"error": "Error in get_task", "details": "404 Not Found"})
+        self.assertEqual(logs.records[0].getMessage(), "Error in get_task for item 123: 404 Not Found")
+
+    async def test_reports_positional_item_id(self):
+        with self.assertLogs(server.logger, "ERROR") as logs:
+            await server.get_task(self.ctx, "123")
+        self.assertEqual(logs.records[0].getMessage(), "Error in get_task for item 123: 404 Not Found")
+
+        reply = json.loads(await server.delete_task(self.ctx, "456"))
+        self.assertEqual(reply["error"], "Error in delete_task for item 456: Authentication failed or missing token.")
+
+    async def test_without_item_arg(self):
+        with self.assertLogs(server.logger, "ERROR") as logs:
+            reply = json.loads(await server.get_tasks(self.ctx))
+        self.assertEqual(reply["error"], "Error in get_tasks")
+        self.assertEqual(logs.records[0].getMessage(), "Error in get_tasks: 404 Not Found")
+
+
+if __name__ == "__main__":
+    unittest.main()
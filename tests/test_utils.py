@@ -0,0 +1,26 @@
+import unittest
+
+from urllib3.response import HTTPResponse
+
+import utils
+
+
+class RetryTest(unittest.TestCase):
+    def test_only_reads_are_retried(self):
+        self.assertTrue(utils._RETRY.is_retry("GET", 503))
+        for method in ("POST", "DELETE", "PUT"):
+            self.assertFalse(utils._RETRY.is_retry(method, 429, has_retry_after=True), method)
+
+    def test_retry_after_is_capped(self):
+        response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+        self.assertEqual(utils._RETRY.get_retry_after(response), utils.RETRY_AFTER_MAX_SECONDS)
+        # urllib3 builds a new Retry per attempt; the cap must survive that.
+        self.assertEqual(utils._RETRY.new(total=1).get_retry_after(response), utils.RETRY_AFTER_MAX_SECONDS)
+
+    def test_short_retry_after_is_kept(self):
+        response = HTTPResponse(status=429, headers={"Retry-After": "2"})
+        self.assertEqual(utils._RETRY.get_retry_after(response), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,64 @@
-from todoist_api_python.api import TodoistAPI
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import sys # For stderr
+import logging
+from typing import TYPE_CHECKING, NamedTuple
 
-def get_todoist_client():
+if TYPE_CHECKING:
+    from todoist_api_python.api import TodoistAPI
+
+logger = logging.getLogger("todoist_mcp")
+
+# Tool calls run the SDK concurrently on worker threads. requests keeps only 10
+# pooled connections per host by default and drops the rest after use, so larger
+# bursts would pay a fresh TCP/TLS handshake to api.todoist.com on every call.
+POOL_MAXSIZE = int(os.getenv("TODOIST_POOL_MAXSIZE", "32"))
+
+# Longest Retry-After the retry will sleep for. The wait blocks an SDK worker thread and the
+# tool call behind it, so a longer server-requested delay is cut short here.
+RETRY_AFTER_MAX_SECONDS = 10
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never sleeps longer than RETRY_AFTER_MAX_SECONDS."""
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+# Rate limits (429) and transient 5xx responses are retried on the pooled connection
+# with a short backoff, honouring Retry-After up to the cap above. Only reads (GET, HEAD,
+# OPTIONS) are retried: the SDK sends creates, updates, closes and Sync commands as POST
+# and deletes as DELETE, and none of those are sent twice. raise_on_status=False hands
+# the final response back to the SDK, which raises its usual HTTPError.
+_RETRY = _CappedRetry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+    raise_on_status=False,
+)
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=_RETRY))
+    return session
+
+class TodoistConnection(NamedTuple):
+    """The SDK client plus the pooled session and token it was built with.
+    The Sync API batching posts through the same session, without reaching into the client's private attributes."""
+    client: "TodoistAPI"
+    session: requests.Session
+    token: str
+
+def get_todoist_client() -> TodoistConnection:
     token = os.getenv("TODOIST_API_TOKEN")
     if not token:
         # This error will be raised if a tool attempts to initialize the client
         # and the token is not found in the environment.
         error_msg = "TODOIST_API_TOKEN not found in environment. This token is required for the Todoist MCP to function. Please set it in your environment or provide it via Smithery configuration."
-        print(f"ERROR in get_todoist_client: {error_msg}", file=sys.stderr)
+        logger.error("ERROR in get_todoist_client: %s", error_msg)
         raise ValueError(error_msg)
-    print("get_todoist_client: Token found, initializing TodoistAPI.", file=sys.stderr)
-    return TodoistAPI(token)
\ No newline at end of file
+    logger.info("get_todoist_client: Token found, initializing TodoistAPI.")
+    from todoist_api_python.api import TodoistAPI # Deferred: the SDK is only loaded once a token is available
+    session = _build_session()
+    return TodoistConnection(TodoistAPI(token, session=session), session, token)